@@ -1,74 +1,103 @@
 import fitz  # PyMuPDF
 import re
+import mmap
 import csv
+from concurrent.futures import ProcessPoolExecutor
 
-def extract_product_data(pdf_path):
-    doc = fitz.open(pdf_path)
-    product_data = []
+try:
+    import re2 as re_fast  # google-re2: linear-time matching, no backtracking
+except ImportError:
+    re_fast = re
+
+# Names start at the first non-space character that isn't a price. Too short
+# names still match, so they take the price that follows them instead of
+# leaving it to the previous product; _process_page drops them after pairing
+_ID_NAME_RE = re.compile(r'(?P<id>[A-Za-z0-9]+(?:\.[A-Za-z0-9]+)+)\s*\|\s*(?P<name>[^\s€][^\n€]*)')
+_PRICE_RE = re.compile(r'€\s*(?P<price>\d+[\.,]\d{1,2})')
+# Single alternation so each page is scanned once, with IDs and prices in document order
+_COMBINED_RE = re_fast.compile(f'{_ID_NAME_RE.pattern}|{_PRICE_RE.pattern}')
+
+# Plain text extraction flags: keep whitespace and clip to the page, but skip
+# the CID/ligature bookkeeping the regexes don't need
+_TEXT_FLAGS = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+
+# Document opened once per worker process by _init_worker
+_DOC = None
+
+def _init_worker(pdf_path):
+    """Open the PDF once per worker so pages don't re-parse the file.
     
-    for page_num, page in enumerate(doc, start=1):
-        text = page.get_text()
-        
-        # Extract all product IDs and names
-        id_name_matches = list(re.finditer(
-            r'(?P<id>[A-Za-z0-9]+(?:\.[A-Za-z0-9]+)+)\s*\|\s*(?P<name>[^\n€]+)',
-            text
-        ))
-        
-        # Extract all prices
-        price_matches = list(re.finditer(
-            r'€\s*(?P<price>\d+[\.,]\d{1,2})',
-            text
-        ))
+    The file is memory-mapped read-only, so the workers share a single copy
+    through the OS page cache rather than each reading it into its own buffer.
+    """
+    global _DOC
+    with open(pdf_path, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    _DOC = fitz.open(stream=memoryview(data), filetype='pdf')
+
+def _process_page(page_num):
+    """Extract the (Page, ID, Name, Price) records of a single (1-based) page"""
+    text = _DOC[page_num - 1].get_text("text", flags=_TEXT_FLAGS)
+    records = []
+    
+    # Walk IDs/names and prices in document order, pairing each product
+    # with the first price that follows it
+    pending = None
+    for match in _COMBINED_RE.finditer(text):
+        if match.lastgroup == 'price':
+            if pending is not None and pending[3] == "Not found":
+                pending[3] = '€' + match.group('price').replace(',', '.')
+            continue
         
-        # Match products to prices by their order on the page
-        for i, id_match in enumerate(id_name_matches):
-            product_id = id_match.group('id')
-            product_name = id_match.group('name').strip()
-            
-            # Get corresponding price (same index)
-            price = "Not found"
-            if i < len(price_matches):
-                price = price_matches[i].group('price').replace(',', '.')
-            
-            product_data.append({
-                'Page': page_num,
-                'ID': product_id,
-                'Name': product_name,
-                'Price': f"€{price}" if price != "Not found" else price
-            })
+        if pending is not None:
+            records.append(tuple(pending))
+        pending = [page_num, match.group('id'), match.group('name').rstrip(), "Not found"]
+    
+    if pending is not None:
+        records.append(tuple(pending))
     
-    return product_data
+    # Clean names and drop too short ones in the worker, so this work is
+    # spread over the pool too
+    return [(page, product_id, clean_product_name(name), price)
+            for page, product_id, name, price in records if len(name) > 3]
+
+def extract_product_data(pdf_path):
+    """Yield one cleaned (Page, ID, Name, Price) tuple per valid ID match, in document order.
+    
+    Pages are independent, so they are spread over a process pool.
+    """
+    with fitz.open(pdf_path) as doc:
+        page_count = doc.page_count
+    
+    with ProcessPoolExecutor(initializer=_init_worker, initargs=(pdf_path,)) as executor:
+        for page_records in executor.map(_process_page, range(1, page_count + 1), chunksize=8):
+            yield from page_records
 
 def clean_product_name(name):
     """Clean up product names by removing extra spaces and newlines"""
-    name = re.sub(r'\s+', ' ', name)  # Replace multiple spaces
-    name = re.sub(r'\s*\n\s*', ' ', name)  # Replace newlines with space
-    return name.strip()
+    # str.split() with no separator collapses any whitespace run, newlines included
+    return ' '.join(name.split())
 
 # Usage
-pdf_path = "catalogue_2024_subset.pdf"
-products = extract_product_data(pdf_path)
-
-# Clean up names and filter valid entries
-cleaned_products = []
-for product in products:
-    # Skip entries where name is just whitespace or too short
-    if len(product['Name'].strip()) > 3:
-        product['Name'] = clean_product_name(product['Name'])
-        cleaned_products.append(product)
+if __name__ == "__main__":
+    pdf_path = "catalogue_2024_subset.pdf"
+    valid_count = 0
 
-# Print results
-print("EXTRACTED PRODUCTS:\n")
-for product in cleaned_products[:50]:  # Print first 50 results
-    print(f"Page {product['Page']:>2} | {product['ID']:>10} | {product['Name'][:50]:<50} | {product['Price']}")
+    print("EXTRACTED PRODUCTS:\n")
 
-# Save to CSV
-with open('product_prices_accurate.csv', 'w', newline='', encoding='utf-8') as csvfile:
-    fieldnames = ['Page', 'ID', 'Name', 'Price']
-    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(cleaned_products)
+    # Extract and save in a single pass so no product list is held in memory
+    # A 1 MiB buffer keeps the number of write() calls low on large catalogues
+    with open('product_prices_accurate.csv', 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(('Page', 'ID', 'Name', 'Price'))
+        
+        for product in extract_product_data(pdf_path):
+            writer.writerow(product)
+            valid_count += 1
+            
+            if valid_count <= 50:  # Print first 50 results
+                page, product_id, name, price = product
+                print(f"Page {page:>2} | {product_id:>10} | {name[:50]:<50} | {price}")
 
-print(f"\nTotal valid products found: {len(cleaned_products)}")
-print("Results saved to product_prices_accurate.csv")
\ No newline at end of file
+    print(f"\nTotal valid products found: {valid_count}")
+    print("Results saved to product_prices_accurate.csv")
\ No newline at end of file
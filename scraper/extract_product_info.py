@@ -1,55 +1,167 @@
 import fitz
 import os
 import re
+import mmap
 import csv
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
-def extract_product_text_data(pdf_path, output_folder, pattern=r'[\d\w]+\.[\d\w]+[A-Z]?\s*\|'):
+try:
+    import re2 as re_fast  # google-re2: linear-time matching, no backtracking
+except ImportError:
+    re_fast = re
+
+# Patterns used by parse_product_text, compiled once at import
+_LEADING_DOT_RE = re.compile(r'^[\.\s]+')
+_NAME_RE = re.compile(r'^([^,]+?)(?:\s+\d+g/m²|,)')
+_NAME_FALLBACK_RE = re.compile(r'^([^,]+)')
+# Sizes pattern (XS – S – M – L – XL – XXL – 3XL – 4XL* – 5XL*)
+# The size list is an atomic group so the engine never backtracks into it.
+# The run up to the price is possessive: it takes non-digits and whole digit
+# runs until it reaches the digit run that belongs to the '12 €' style price,
+# so it ends exactly where the old lazy [^€]*? did without trying every
+# extension. Searched through _find_sizes, which keeps the work per start
+# position bounded without capping the run's length.
+_SIZES_RE = re.compile(
+    r'((?>(?:XS|S|M|L|XL|XXL|\d+XL\*?)(?:\s*[–-]\s*(?:XS|S|M|L|XL|XXL|\d+XL\*?))*)'
+    r'(?:[^€\d]|(?>\d+)(?!\s*€|\s+\d+\s*€))*+)'
+    r'(?=\d+\s*€|\d+\s+\d+\s*€)'
+)
+# A price as the sizes match needs it to follow: digits, then the euro sign
+_PRICE_TAIL_RE = re.compile(r'\d+\s*€')
+_SIZES_NOTE_RE = re.compile(r'\s*\*[^€]*')
+_MULTI_SPACE_RE = re.compile(r'\s{2,}')
+_PRICE_RE = re.compile(r'€\s*(\d+(?:[,.-]\d+)*)')
+_WS_RE = re.compile(r'\s+')
+
+# Plain text extraction flags: keep whitespace and clip to the page, but skip
+# the CID/ligature bookkeeping the regexes don't need
+_TEXT_FLAGS = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+
+# Document opened once per worker process by _init_worker
+_DOC = None
+
+def _init_worker(pdf_path):
+    """Open the PDF once per worker so pages don't re-parse the file.
+    
+    The file is memory-mapped read-only, so the workers share a single copy
+    through the OS page cache rather than each reading it into its own buffer.
+    """
+    global _DOC
+    with open(pdf_path, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    _DOC = fitz.open(stream=memoryview(data), filetype='pdf')
+
+# Page texts of the most recently read PDF, keyed by (path, mtime) so an
+# edited file is re-read; lets reruns with another pattern skip MuPDF entirely
+_PAGE_TEXT_CACHE = {}
+
+def _process_page(page_num, pattern):
+    """Read a single (0-based) page and parse it, returning (text, products)"""
+    # Get all text from the page
+    text_content = _DOC[page_num].get_text("text", flags=_TEXT_FLAGS)
+    return text_content, _parse_page_text(text_content, page_num, pattern)
+
+def _parse_page_text(text_content, page_num, pattern):
+    """Parse every product matching the ID pattern string in the text of a (0-based) page"""
+    page_products = []
+    
+    # Find all matches of the pattern in the text
+    matches = list(_id_pattern(pattern).finditer(text_content))
+    
+    for i, match in enumerate(matches):
+        try:
+            # Get the position of the match
+            match_start = match.start()
+            
+            # A record ends where the next product ID starts; the last one on
+            # the page falls back to the next ~1000 characters
+            if i + 1 < len(matches):
+                match_end = matches[i + 1].start()
+            else:
+                match_end = min(match_start + 1000, len(text_content))
+            
+            text_chunk = text_content[match_start:match_end]
+            
+            # Parse the product information
+            product_data = parse_product_text(text_chunk, page_num + 1)
+            
+            if product_data:
+                page_products.append(product_data)
+            
+        except Exception as e:
+            print(f"⚠️ Error parsing product on page {page_num + 1}: {e}")
+    
+    return page_products
+
+# Product ID patterns compiled in this process, keyed by the pattern string.
+# RE2 patterns can't be pickled, so workers are sent the string and compile
+# it once each
+_ID_PATTERNS = {}
+
+def _id_pattern(pattern):
+    """Return the compiled product ID pattern, preferring RE2 when it supports the syntax"""
+    compiled = _ID_PATTERNS.get(pattern)
+    if compiled is None:
+        flagged = f'(?ms){pattern}'  # MULTILINE | DOTALL, inline so both engines accept it
+        try:
+            compiled = re_fast.compile(flagged)
+        except re_fast.error:
+            compiled = re.compile(flagged)  # lookarounds/backreferences need the backtracking engine
+        _ID_PATTERNS[pattern] = compiled
+    return compiled
+
+def _iter_page_products(pdf_path, pattern):
+    """Yield (page_num, products) for every page, reusing cached page text"""
+    cache_key = (os.path.abspath(pdf_path), os.path.getmtime(pdf_path))
+    page_texts = _PAGE_TEXT_CACHE.get(cache_key)
+    
+    if page_texts is not None:
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(partial(_parse_page_text, pattern=pattern),
+                                   page_texts, range(len(page_texts)), chunksize=8)
+            yield from enumerate(results)
+        return
+    
+    with fitz.open(pdf_path) as doc:
+        page_count = doc.page_count
+    
+    page_texts = []
+    with ProcessPoolExecutor(initializer=_init_worker, initargs=(pdf_path,)) as executor:
+        results = executor.map(partial(_process_page, pattern=pattern), range(page_count), chunksize=8)
+        for page_num, (text_content, page_products) in enumerate(results):
+            page_texts.append(text_content)
+            yield page_num, page_products
+    
+    _PAGE_TEXT_CACHE.clear()
+    _PAGE_TEXT_CACHE[cache_key] = page_texts
+
+def extract_product_text_data(pdf_path, output_folder, pattern=r'[\d\w]+\.[\d\w]+[A-Z]?\s*\|', verbose=False):
     """
     Extract product text data from PDF that matches the specified pattern.
     
+    Pages are parsed in parallel across a process pool.
+    
     Args:
         pdf_path: Path to the PDF file
         output_folder: Directory to save CSV file
         pattern: Regex pattern to match product IDs (default matches '01.003T |' style patterns)
+        verbose: Print every product and per-page counts (default only prints the summary)
     """
-    doc = fitz.open(pdf_path)
     os.makedirs(output_folder, exist_ok=True)
     
     extracted_products = []
     total_found = 0
     
-    for page_num, page in enumerate(doc):
-        # Get all text from the page
-        text_content = page.get_text()
-        
-        # Find all matches of the pattern in the text
-        matches = re.finditer(pattern, text_content, re.MULTILINE | re.DOTALL)
-        
-        page_products = 0
+    # Workers get the pattern string and compile it themselves, see _id_pattern
+    for page_num, page_products in _iter_page_products(pdf_path, pattern):
+        extracted_products.extend(page_products)
+        total_found += len(page_products)
         
-        for match in matches:
-            try:
-                # Get the position of the match
-                match_start = match.start()
-                match_end = match.end()
-                
-                # Extract a larger chunk of text around the match (next ~1000 characters)
-                text_chunk = text_content[match_start:match_start + 1000]
-                
-                # Parse the product information
-                product_data = parse_product_text(text_chunk, page_num + 1)
-                
-                if product_data:
-                    extracted_products.append(product_data)
-                    page_products += 1
-                    total_found += 1
-                    print(f"✓ Found product on page {page_num + 1}: {product_data['id']} | {product_data['name']}")
-                
-            except Exception as e:
-                print(f"⚠️ Error parsing product on page {page_num + 1}: {e}")
-        
-        if page_products > 0:
-            print(f"📄 Page {page_num + 1}: Found {page_products} products")
+        if verbose and page_products:
+            for product_data in page_products:
+                print(f"✓ Found product on page {page_num + 1}: {product_data['id']} | {product_data['name']}")
+            print(f"📄 Page {page_num + 1}: Found {len(page_products)} products")
     
     print(f"\n🎯 Total products found: {total_found}")
     
@@ -64,8 +176,21 @@ def extract_product_text_data(pdf_path, output_folder, pattern=r'[\d\w]+\.[\d\w]
         print(f"💾 Product data saved to: {csv_path}")
     else:
         print("⚠️ No products found to save")
+
+def _find_sizes(rest_text):
+    """Search for the sizes run one €-delimited stretch of text at a time.
     
-    doc.close()
+    A match can't contain '€' and has to end just before a price, so only
+    the stretches that end in a price can hold it. Stretches without one are
+    skipped, instead of every size-like start in them scanning to their end.
+    """
+    for price_match in _PRICE_TAIL_RE.finditer(rest_text):
+        euro = price_match.end() - 1
+        stretch_start = rest_text.rfind('€', 0, euro) + 1
+        sizes_match = _SIZES_RE.search(rest_text, stretch_start, euro + 1)
+        if sizes_match:
+            return sizes_match
+    return None
 
 def parse_product_text(text_chunk, page_num):
     """
@@ -84,39 +209,38 @@ def parse_product_text(text_chunk, page_num):
         rest_text = parts[1].strip()
         
         # Extract ID (remove leading dots and spaces)
-        product_id = re.sub(r'^[\.\s]+', '', id_part).strip()
+        product_id = _LEADING_DOT_RE.sub('', id_part).strip()
         
         # Extract name - look for pattern like "B&C #E190 Schweres T-Shirt" (stops at first comma or specification)
         # Match brand and product name until first comma or number+g/m²
-        name_match = re.match(r'^([^,]+?)(?:\s+\d+g/m²|,)', rest_text)
+        name_match = _NAME_RE.match(rest_text)
         if not name_match:
             # Fallback: get first part until comma
-            name_match = re.match(r'^([^,]+)', rest_text)
+            name_match = _NAME_FALLBACK_RE.match(rest_text)
         name = name_match.group(1).strip() if name_match else ""
         
-        # Extract sizes pattern (XS – S – M – L – XL – XXL – 3XL – 4XL* – 5XL*)
-        sizes_pattern = r'((?:XS|S|M|L|XL|XXL|\d+XL)(?:\s*[–-]\s*(?:XS|S|M|L|XL|XXL|\d+XL|\d+XL\*))*[^€]*?)(?=\d+\s*€|\d+\s+\d+\s*€)'
-        sizes_match = re.search(sizes_pattern, rest_text)
+        # Extract sizes
+        sizes_match = _find_sizes(rest_text)
         sizes = sizes_match.group(1).strip() if sizes_match else ""
         
         # Clean up sizes (remove extra text after the size list)
         if sizes:
             # Keep only the size part, remove descriptions after
-            sizes = re.sub(r'\s*\*[^€]*', '*', sizes)  # Keep asterisks but remove their descriptions
-            sizes = re.sub(r'\s{2,}', ' ', sizes)  # Replace multiple spaces with single space
+            sizes = _SIZES_NOTE_RE.sub('*', sizes)  # Keep asterisks but remove their descriptions
+            sizes = _MULTI_SPACE_RE.sub(' ', sizes)  # Replace multiple spaces with single space
         
         # Extract price (look for number after € symbol)
-        price_pattern = r'€\s*(\d+(?:[,.-]\d+)*)'
-        price_match = re.search(price_pattern, rest_text)
+        price_match = _PRICE_RE.search(rest_text)
         price = price_match.group(1) if price_match else ""
         
-        # Get description (everything between name and sizes)
+        # Get description (everything between name and sizes); slice at the
+        # sizes match instead of searching for the cleaned sizes string again
         description = rest_text
         if sizes:
-            description = rest_text.split(sizes)[0].strip()
+            description = rest_text[:sizes_match.start()]
         
         # Clean up description
-        description = re.sub(r'\s+', ' ', description).strip()
+        description = _WS_RE.sub(' ', description).strip()
         
         return {
             'page': page_num,
@@ -132,7 +256,7 @@ def parse_product_text(text_chunk, page_num):
         print(f"⚠️ Error parsing product text: {e}")
         return None
 
-def extract_product_text_custom_pattern(pdf_path, output_folder, custom_pattern):
+def extract_product_text_custom_pattern(pdf_path, output_folder, custom_pattern, verbose=False):
     """
     Wrapper function to use a custom regex pattern.
     
@@ -141,7 +265,7 @@ def extract_product_text_custom_pattern(pdf_path, output_folder, custom_pattern)
     - r'\d+\.\d+\s*\|' (matches '16.1426 |')
     - r'[A-Z0-9]+\.\d+\s*\|' (matches alphanumeric codes)
     """
-    return extract_product_text_data(pdf_path, output_folder, custom_pattern)
+    return extract_product_text_data(pdf_path, output_folder, custom_pattern, verbose)
 
 
 
@@ -2,6 +2,14 @@ import csv
 import time
 import re
 import json
+import sys
+import argparse
+import requests
+from collections import deque
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
@@ -9,21 +17,322 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException
+from bs4 import BeautifulSoup, SoupStrainer, FeatureNotFound
 import logging
 
+try:
+    import orjson  # Much faster JSON encoding, including indented output
+except ImportError:
+    orjson = None
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Price patterns tried in order of confidence: euro sign after, euro sign
+# before, a standalone amount, then any amount-looking number
+PRICE_PATTERNS = [re.compile(p) for p in (
+    r'(\d+[.,]\d{2})\s*€',
+    r'€\s*(\d+[.,]\d{2})',
+    r'\b(\d+[.,]\d{2})\b',
+    r'(\d{1,4}[.,]\d{2})',
+)]
+NON_WORD_RE = re.compile(r'[^\w\s]')
+# TextileWorld.eu page segment, e.g. .../order/relevance/p/3/
+PAGE_IN_URL_RE = re.compile(r'/p/(\d+)/')
+# Page number in either pagination style: ?p=3 / &p=3, or /p/3/
+PAGE_NUMBER_IN_HREF_RE = re.compile(r'(?:[?&]p=|/p/)(\d+)')
+# Magento's "last page" link: <li class="pages-item-last"><a class="page last">,
+# or <a class="last"> in older themes
+LAST_PAGE_STRAINER = SoupStrainer(['li', 'a'], attrs={'class': re.compile(r'(?:^|\s)(?:last|pages-item-last)(?:\s|$)')})
+
+# Brand checks as one alternation, so each string is scanned once rather than once per brand
+BRAND_RE = re.compile('jack|jones|morning|soya|selected')
+BRAND_MENTION_RE = re.compile('jack & jones|jack&jones|new morning|soyaconcept|selected homme')
+
+# Links that may be products, counted by count_products_on_current_page
+PRODUCT_LINK_SELECTORS = [
+    "a[href*='html']",
+    "a[title]",
+    ".product-item a",
+    ".product a",
+    "a[href*='product']"
+]
+
+# Both product counts of count_products_on_current_page, computed in the browser
+# so only a few integers cross WebDriver: per selector, how many elements have a
+# brand in "href title text", and (unless the caller has the page source
+# already) how many brand mentions the serialised page contains
+PRODUCT_COUNT_SCRIPT = """
+var selectors = arguments[0], brandRe = new RegExp(arguments[1]);
+var linkCounts = selectors.map(function (selector) {
+    return Array.from(document.querySelectorAll(selector)).filter(function (el) {
+        return brandRe.test(((el.href || '') + ' ' + (el.title || '') + ' ' + (el.innerText || '')).toLowerCase());
+    }).length;
+});
+var mentions = null;
+if (arguments[3]) {
+    mentions = (document.documentElement.outerHTML.toLowerCase().match(new RegExp(arguments[2], 'g')) || []).length;
+}
+return {link_counts: linkCounts, mentions: mentions};
+"""
+
+# Runs every next-button selector and the next/previous checks in the browser,
+# returning the valid candidates (element, href, text) in selector order in a
+# single WebDriver round-trip. ":contains('x')" selectors match links by text
+NEXT_BUTTON_CANDIDATES_SCRIPT = """
+var selectors = arguments[0], targetPage = String(arguments[1]);
+var seen = new Set(), candidates = [];
+
+function isValid(e) {
+    if (!(e.offsetWidth || e.offsetHeight || e.getClientRects().length) || e.disabled) return false;
+    
+    var text = (e.innerText || '').trim(), lower = text.toLowerCase();
+    var rawHref = e.getAttribute('href');
+    var href = rawHref === null ? null : e.href;
+    var title = (e.getAttribute('title') || '').toLowerCase();
+    var classes = (e.getAttribute('class') || '').toLowerCase();
+    
+    // Skip disabled buttons and javascript void links
+    if (classes.indexOf('disabled') !== -1 || e.hasAttribute('disabled')) return false;
+    if (href && (href.indexOf('javascript:') !== -1 || rawHref === '#')) return false;
+    
+    // "Next" indicators (English/German), the numeric target page, or /p/N/ in the URL
+    var isNext = lower.indexOf('next') !== -1 || lower.indexOf('weiter') !== -1 ||
+        lower.indexOf('nächste') !== -1 || title.indexOf('next') !== -1 ||
+        title.indexOf('weiter') !== -1 || ['>', '»', '→'].indexOf(text) !== -1 ||
+        (/^[0-9]+$/.test(text) && String(parseInt(text, 10)) === targetPage) ||
+        (!!href && href.indexOf('/p/' + targetPage + '/') !== -1);
+    
+    // Avoid previous buttons
+    var isPrev = lower.indexOf('previous') !== -1 || lower.indexOf('zurück') !== -1 ||
+        lower.indexOf('vorherige') !== -1 || ['<', '«', '←'].indexOf(text) !== -1;
+    
+    return isNext && !isPrev;
+}
+
+selectors.forEach(function (selector) {
+    var elements;
+    var contains = selector.match(/:contains\\(['"](.*)['"]\\)/);
+    if (contains) {
+        elements = Array.from(document.querySelectorAll('a')).filter(function (a) {
+            return a.textContent.indexOf(contains[1]) !== -1;
+        });
+    } else {
+        try { elements = Array.from(document.querySelectorAll(selector)); } catch (err) { return; }
+    }
+    elements.forEach(function (e) {
+        if (seen.has(e) || !isValid(e)) return;
+        seen.add(e);
+        candidates.push({element: e, href: e.getAttribute('href') === null ? null : e.href, text: (e.innerText || '').trim()});
+    });
+});
+return candidates;
+"""
+
+# The first visible pagination container with its links, in one round-trip
+PAGINATION_INFO_SCRIPT = """
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    var containers = document.querySelectorAll(selectors[i]);
+    for (var j = 0; j < containers.length; j++) {
+        var c = containers[j];
+        if (!(c.offsetWidth || c.offsetHeight || c.getClientRects().length)) continue;
+        return {
+            selector: selectors[i],
+            html: c.outerHTML,
+            links: Array.from(c.querySelectorAll('a'), function (a) {
+                return {text: (a.innerText || '').trim(), title: a.getAttribute('title'), href: a.href || null};
+            })
+        };
+    }
+}
+return null;
+"""
+
+# Per selector: how many elements match plus text/href of the first three,
+# all in one WebDriver round-trip instead of a find_elements call per selector
+SELECTOR_SUMMARY_SCRIPT = """
+return arguments[0].map(function (selector) {
+    var elements = document.querySelectorAll(selector);
+    return {
+        count: elements.length,
+        samples: Array.from(elements).slice(0, 3).map(function (e) {
+            var href = e.getAttribute('href');
+            return {text: (e.innerText || '').trim(), href: href === null ? null : (e.href || href)};
+        })
+    };
+});
+"""
+
+# The first selector with at least one visible element, or null
+FIRST_VISIBLE_SELECTOR_SCRIPT = """
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    var elements = document.querySelectorAll(selectors[i]);
+    for (var j = 0; j < elements.length; j++) {
+        var e = elements[j];
+        if (e.offsetWidth || e.offsetHeight || e.getClientRects().length) return selectors[i];
+    }
+}
+return null;
+"""
+
+# Page-type analysis: pagination elements and AJAX load indicators
+PAGINATION_SELECTORS = [
+    ".pagination",
+    ".pager",
+    ".page-numbers",
+    "[class*='page']",
+    "a[href*='p=']",
+    "a[href*='page=']",
+    ".next",
+    ".pages"
+]
+AJAX_INDICATORS = [
+    "button[class*='load']",
+    "button[class*='more']",
+    ".load-more",
+    "[data-role*='load']",
+    ".ajax-loader",
+    ".loading"
+]
+
+# Common indicators of a valid product page, in order of preference
+VALID_PAGE_INDICATORS = [
+    # Product containers
+    ".products-grid",
+    ".product-items",
+    ".category-products",
+    ".search-results",
+    
+    # At least one product
+    ".product-item",
+    ".item",
+    "[data-product-id]"
+]
+
+# Present once a listing page has rendered its products (TextileWorld renders
+# .listing-item rows)
+PRODUCT_GRID_SELECTOR = '.listing-item, .product-item, .products-grid, .item'
+PAGE_LOAD_TIMEOUT = 10
+
+# Lazy-loading detection: a MutationObserver counts element nodes added to the
+# page since the counter was last reset. Resetting installs the observer if the
+# current document doesn't have one yet (e.g. after a navigation)
+RESET_NEW_NODES_SCRIPT = """
+if (!window.__scraperObserver) {
+    window.__scraperObserver = new MutationObserver(function (mutations) {
+        mutations.forEach(function (m) {
+            m.addedNodes.forEach(function (n) { if (n.nodeType === 1) window.__scraperNewNodes++; });
+        });
+    });
+    window.__scraperObserver.observe(document.body, {childList: true, subtree: true});
+}
+window.__scraperNewNodes = 0;
+"""
+# A document without the counter is a new page, which counts as new content
+NEW_NODES_SCRIPT = "return window.__scraperNewNodes === undefined ? 1 : window.__scraperNewNodes;"
+SCROLL_WAIT_TIMEOUT = 5
+
+# Load-more candidates, most specific first: "Load More"/"Show More" buttons,
+# .load-more/.show-more elements, then any button with "load" in its class
+LOAD_MORE_XPATHS = [
+    "//button[contains(text(), 'Load More')]",
+    "//button[contains(text(), 'Show More')]",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' load-more ')]",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' show-more ')]",
+    "//button[contains(@class, 'load')]",
+]
+# The first visible, enabled match of the first XPath in arguments[0] that has
+# one (or null), so candidates keep their priority in a single round-trip
+LOAD_MORE_BUTTON_SCRIPT = """
+var xpaths = arguments[0];
+for (var i = 0; i < xpaths.length; i++) {
+    var found = document.evaluate(xpaths[i], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var j = 0; j < found.snapshotLength; j++) {
+        var e = found.snapshotItem(j);
+        if ((e.offsetWidth || e.offsetHeight || e.getClientRects().length) && !e.disabled) return e;
+    }
+}
+return null;
+"""
+# Listing containers, outermost first (Magento 1 nests .products-grid rows
+# inside .category-products), so the first one found covers the whole listing
+PRODUCT_GRID_CONTAINERS = ['.category-products', '.products-grid']
+
+# Subresources the scraper never looks at; blocked over CDP to cut bytes per page.
+# Stylesheets stay loaded because the pagination code relies on element visibility
+BLOCKED_RESOURCE_URLS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.woff", "*.woff2", "*.ttf"]
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+def url_pagination_pattern(base_url):
+    """Return a '{page}' URL pattern for ?p=N style pagination of base_url"""
+    separator = "&" if "?" in base_url else "?"
+    return f"{base_url}{separator}p={{page}}"
+
+def _scrape_page_range(page_url_pattern, pages, headless, worker_index):
+    """Process-pool worker: scrape the given pages in a dedicated Chrome instance.
+    
+    WebDriver sessions can't be shared between threads or processes, so every
+    worker owns its own scraper. Returns {page: products} for the pages that
+    had products, stopping at the first empty one. Magento serves the last
+    page again for page numbers past the end, so a page that only repeats
+    the worker's previous page stops it too.
+    """
+    time.sleep(worker_index * 0.1)  # Stagger start-up so workers don't hit the site at once
+    
+    scraper = ImprovedTextileWorldScraper(headless=headless)
+    if not scraper.setup_chrome_driver():
+        return {}
+    
+    results = {}
+    previous_keys = set()
+    try:
+        for page in pages:
+            scraper.driver.get(page_url_pattern.format(page=page))
+            scraper.wait_for_products()
+            
+            page_products = scraper.extract_products_from_current_page()
+            if not page_products:
+                break
+            
+            page_keys = {scraper.product_key(product) for product in page_products} - {None}
+            if page_keys and page_keys <= previous_keys:
+                break
+            previous_keys = page_keys
+            results[page] = page_products
+    except Exception as e:
+        logger.error(f"Worker {worker_index} failed: {e}")
+    finally:
+        scraper.driver.quit()
+    
+    return results
+
 class ImprovedTextileWorldScraper:
-    def __init__(self, headless=False, target_count=3000):
+    def __init__(self, headless=False, target_count=3000, browser_workers=1):
         self.target_count = target_count
         self.found_products = set()
         self.driver = None
         self.headless = headless
         self.max_scroll_attempts = 50  # Reduced for more focused approach
         self.products_data = []
+        self.static_fetch_workers = 4  # Concurrent plain-HTTP page fetches; all go to one host
+        self.static_fetch_delay = 0.5  # Minimum seconds between plain-HTTP request starts
+        self.browser_workers = min(browser_workers, 8)  # Parallel Chrome instances; more risks rate limiting
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': USER_AGENT})
+        # One kept-alive connection per fetch worker, and retry transient failures
+        # with backoff instead of treating them as the end of the listing
+        adapter = HTTPAdapter(
+            pool_connections=self.static_fetch_workers,
+            pool_maxsize=self.static_fetch_workers,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
     def setup_chrome_driver(self):
         """Enhanced Chrome driver setup"""
@@ -34,9 +343,18 @@ class ImprovedTextileWorldScraper:
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        chrome_options.add_argument(f"--user-agent={USER_AGENT}")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        # Don't fetch or decode images at all, and never show notification prompts.
+        # Stylesheets stay on: the pagination code depends on is_displayed()/layout
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        # Return from get() at DOMContentLoaded instead of waiting for every subresource
+        chrome_options.page_load_strategy = 'eager'
         
         if self.headless:
             chrome_options.add_argument("--headless=new")
@@ -44,64 +362,63 @@ class ImprovedTextileWorldScraper:
         try:
             self.driver = webdriver.Chrome(options=chrome_options)
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            self.driver.implicitly_wait(10)
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_URLS})
             logger.info("✓ Chrome driver initialized successfully")
             return True
         except Exception as e:
             logger.error(f"✗ Driver setup failed: {e}")
             return False
     
+    def wait_for_products(self, timeout=PAGE_LOAD_TIMEOUT):
+        """Wait until the product grid is in the DOM; returns False on timeout"""
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, PRODUCT_GRID_SELECTOR))
+            )
+            return True
+        except TimeoutException:
+            logger.debug(f"No product grid after {timeout}s")
+            return False
+    
+    def wait_for_more_content(self, timeout=SCROLL_WAIT_TIMEOUT):
+        """Wait until nodes were added since the last RESET_NEW_NODES_SCRIPT; returns False on timeout"""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(
+                lambda driver: driver.execute_script(NEW_NODES_SCRIPT) > 0
+            )
+            return True
+        except TimeoutException:
+            return False
+    
     def analyze_page_type(self):
         """Determine what type of pagination/loading this page uses"""
         logger.info("=== ANALYZING PAGE TYPE ===")
         
-        # Check for pagination elements
-        pagination_selectors = [
-            ".pagination",
-            ".pager",
-            ".page-numbers",
-            "[class*='page']",
-            "a[href*='p=']",
-            "a[href*='page=']",
-            ".next",
-            ".pages"
-        ]
+        # One script call covers every pagination and AJAX selector
+        try:
+            summaries = self.driver.execute_script(SELECTOR_SUMMARY_SCRIPT, PAGINATION_SELECTORS + AJAX_INDICATORS)
+        except:
+            summaries = [{'count': 0, 'samples': []}] * (len(PAGINATION_SELECTORS) + len(AJAX_INDICATORS))
+        pagination_summaries = summaries[:len(PAGINATION_SELECTORS)]
+        ajax_summaries = summaries[len(PAGINATION_SELECTORS):]
         
         pagination_found = False
-        for selector in pagination_selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    logger.info(f"Found pagination: {selector} ({len(elements)} elements)")
-                    pagination_found = True
-                    # Get sample links
-                    for elem in elements[:3]:
-                        href = elem.get_attribute("href")
-                        text = elem.text.strip()
-                        if href and text:
-                            logger.info(f"  Pagination link: '{text}' -> {href}")
-            except:
-                continue
+        for selector, summary in zip(PAGINATION_SELECTORS, pagination_summaries):
+            if summary['count']:
+                logger.info(f"Found pagination: {selector} ({summary['count']} elements)")
+                pagination_found = True
+                # Get sample links
+                for sample in summary['samples']:
+                    if sample['href'] and sample['text']:
+                        logger.info(f"  Pagination link: '{sample['text']}' -> {sample['href']}")
         
         # Check for AJAX load indicators
-        ajax_indicators = [
-            "button[class*='load']",
-            "button[class*='more']",
-            ".load-more",
-            "[data-role*='load']",
-            ".ajax-loader",
-            ".loading"
-        ]
-        
         ajax_found = False
-        for selector in ajax_indicators:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    logger.info(f"Found AJAX indicator: {selector} ({len(elements)} elements)")
-                    ajax_found = True
-            except:
-                continue
+        for selector, summary in zip(AJAX_INDICATORS, ajax_summaries):
+            if summary['count']:
+                logger.info(f"Found AJAX indicator: {selector} ({summary['count']} elements)")
+                ajax_found = True
         
         # Check URL structure for clues
         current_url = self.driver.current_url
@@ -129,23 +446,33 @@ class ImprovedTextileWorldScraper:
         page = 1
         max_pages = 50  # Safety limit
         
+        page_url_pattern = url_pagination_pattern(base_url)
+        
+        # Pages are plain ?p=N URLs, so try fetching them without the browser first
+        static_products = self.fetch_all_pages(page_url_pattern, max_pages)
+        if static_products:
+            return static_products
+        
+        if self.browser_workers > 1:
+            return self.handle_url_pagination_parallel(page_url_pattern, max_pages)
+        
         while page <= max_pages:
             logger.info(f"\n--- Processing Page {page} ---")
             
             # Construct page URL
-            if "?" in base_url:
-                page_url = f"{base_url}&p={page}"
-            else:
-                page_url = f"{base_url}?p={page}"
+            page_url = page_url_pattern.format(page=page)
             
             logger.info(f"Loading: {page_url}")
             
             try:
                 self.driver.get(page_url)
-                time.sleep(3)
+                self.wait_for_products()
+                
+                # Serialise the DOM once and share it between counting and extraction
+                html = self.driver.page_source
                 
                 # Count products on this page
-                products_on_page = self.count_products_on_current_page()
+                products_on_page = self.count_products_on_current_page(html)
                 logger.info(f"Products found on page {page}: {products_on_page}")
                 
                 if products_on_page == 0:
@@ -153,7 +480,7 @@ class ImprovedTextileWorldScraper:
                     break
                 
                 # Extract products from current page
-                page_products = self.extract_products_from_current_page()
+                page_products = self.extract_products_from_current_page(html)
                 all_products.extend(page_products)
                 
                 logger.info(f"Total products collected: {len(all_products)}")
@@ -177,6 +504,40 @@ class ImprovedTextileWorldScraper:
         return all_products
     
     
+    def handle_url_pagination_parallel(self, page_url_pattern, max_pages):
+        """Handle URL-based pagination with one Chrome instance per worker process"""
+        logger.info(f"=== HANDLING URL PAGINATION ({self.browser_workers} BROWSER WORKERS) ===")
+        
+        # Don't hand out pages past the last one linked from the current page
+        last_page = self.find_last_page_number(self.driver.page_source)
+        if last_page and last_page < max_pages:
+            logger.info(f"Listing has {last_page} pages")
+            max_pages = last_page
+        
+        # Interleave pages across workers so each one can stop at its first empty page
+        pages = list(range(1, max_pages + 1))
+        page_results = {}
+        
+        with ProcessPoolExecutor(max_workers=self.browser_workers) as executor:
+            futures = [
+                executor.submit(_scrape_page_range, page_url_pattern,
+                                pages[i::self.browser_workers], self.headless, i)
+                for i in range(self.browser_workers)
+            ]
+            for future in futures:
+                page_results.update(future.result())
+        
+        # Merge in page order, stopping at the first gap (the real last page)
+        all_products = []
+        for page in pages:
+            if page not in page_results:
+                break
+            all_products.extend(page_results[page])
+        
+        all_products = self.deduplicate_products(all_products)
+        logger.info(f"Total products collected: {len(all_products)}")
+        return all_products[:self.target_count] if len(all_products) > self.target_count else all_products
+    
     def handle_traditional_pagination(self):
         """Handle traditional pagination with next buttons - TextileWorld.eu specific"""
         logger.info("=== HANDLING TRADITIONAL PAGINATION (TextileWorld.eu) ===")
@@ -202,6 +563,11 @@ class ImprovedTextileWorldScraper:
             if page == 1:
                 base_url_pattern = self.extract_base_url_pattern(current_url)
                 logger.info(f"Detected base URL pattern: {base_url_pattern}")
+                
+                # Try fetching the pages without the browser first
+                static_products = self.fetch_all_pages(base_url_pattern, 50)
+                if static_products:
+                    return static_products
             
             # Extract products from current page
             page_products = self.extract_products_from_current_page()
@@ -220,7 +586,6 @@ class ImprovedTextileWorldScraper:
                 logger.info("Could not navigate to next page - pagination complete")
                 break
             
-            time.sleep(3)
             page += 1
             
             if len(all_products) >= self.target_count:
@@ -229,15 +594,117 @@ class ImprovedTextileWorldScraper:
         
         return all_products
 
+    def fetch_page_html(self, url):
+        """Fetch a page over plain HTTP, returning its HTML or None on failure"""
+        try:
+            response = self.session.get(url, timeout=15)
+            response.raise_for_status()
+            return response.text
+        except requests.RequestException as e:
+            logger.debug(f"Static fetch failed for {url}: {e}")
+            return None
+    
+    def fetch_all_pages(self, base_url_pattern, max_pages):
+        """Fetch paginated pages concurrently over HTTP instead of through Chrome.
+        
+        Up to `static_fetch_workers` pages are in flight at once, with a new
+        request starting at most every `static_fetch_delay` seconds; as each page
+        is processed (in order) the next one is requested, until a page has no
+        new products, `max_pages` (or the last page linked from page 1) is hit or
+        the target is reached. Magento serves the last page again for page
+        numbers past the end, so a page with nothing new is the end too.
+        Returns an empty list when the first page yields nothing (e.g. the
+        listing is rendered by JavaScript), so callers can fall back to Selenium.
+        """
+        logger.info(f"=== FETCHING PAGES OVER HTTP ({self.static_fetch_workers} workers) ===")
+        
+        all_products = []
+        seen_keys = set()
+        pending = deque()
+        next_page = 1
+        last_request = None
+        
+        with ThreadPoolExecutor(max_workers=self.static_fetch_workers) as executor:
+            while True:
+                # Keep the pool full so a slow page doesn't stall the ones after it
+                while len(pending) < self.static_fetch_workers and next_page <= max_pages:
+                    # Space the requests out so the site doesn't rate limit us
+                    if last_request is not None:
+                        wait = last_request + self.static_fetch_delay - time.monotonic()
+                        if wait > 0:
+                            time.sleep(wait)
+                    last_request = time.monotonic()
+                    
+                    page_url = base_url_pattern.format(page=next_page)
+                    pending.append((next_page, page_url, executor.submit(self.fetch_page_html, page_url)))
+                    next_page += 1
+                
+                if not pending:
+                    break
+                
+                page, page_url, future = pending.popleft()
+                html = future.result()
+                page_products = self.extract_products_from_html(html, page_url) if html else []
+                
+                if not page_products:
+                    if page == 1:
+                        logger.info("No products in static HTML - falling back to browser")
+                    else:
+                        logger.info(f"No products found on page {page} - reached end")
+                    break
+                
+                page_keys = {self.product_key(product) for product in page_products} - {None}
+                if page_keys and page_keys <= seen_keys:
+                    logger.info(f"Page {page} only repeats earlier products - reached end")
+                    break
+                seen_keys |= page_keys
+                
+                all_products.extend(page_products)
+                logger.info(f"Page {page}: {len(page_products)} products (total {len(seen_keys)} unique)")
+                
+                if len(seen_keys) >= self.target_count:
+                    logger.info(f"Target reached! Collected {len(seen_keys)} products")
+                    break
+                
+                # Page 1 may link the last page; then nothing past it is requested
+                if page == 1:
+                    last_page = self.find_last_page_number(html)
+                    if last_page and last_page < max_pages:
+                        logger.info(f"Listing has {last_page} pages")
+                        max_pages = last_page
+                        while pending and pending[-1][0] > max_pages:
+                            pending.pop()[2].cancel()
+            
+            # Pages past the end don't need fetching
+            for _, _, future in pending:
+                future.cancel()
+        
+        return self.deduplicate_products(all_products)
+
+    def find_last_page_number(self, html):
+        """Return the page number of the listing's "last page" link, or None if it has none.
+        
+        Only an explicit last-page link is trusted: numbered links show a window
+        of pages around the current one, not the end of the listing.
+        """
+        try:
+            soup = BeautifulSoup(html, 'lxml', parse_only=LAST_PAGE_STRAINER)
+        except FeatureNotFound:
+            soup = BeautifulSoup(html, 'html.parser', parse_only=LAST_PAGE_STRAINER)
+        
+        for link in soup.find_all('a', href=True):
+            page_match = PAGE_NUMBER_IN_HREF_RE.search(link['href'])
+            if page_match:
+                return int(page_match.group(1))
+        return None
+    
     def extract_base_url_pattern(self, url):
         """Extract the base URL pattern for TextileWorld.eu pagination"""
-        import re
-        
         # Pattern: https://www.textileworld.eu/catalogsearch/result/index/cc_geschlecht/3945/dir/desc/order/relevance/p/1/
         # We want: https://www.textileworld.eu/catalogsearch/result/index/cc_geschlecht/3945/dir/desc/order/relevance/p/{page}/
         
         # Replace the page number with a placeholder
-        pattern = re.sub(r'/p/\d+/', '/p/{page}/', url)
+        pattern = PAGE_IN_URL_RE.sub('/p/{page}/', url)
         
         # If no /p/number/ pattern found, try to construct it
         if '{page}' not in pattern:
@@ -258,7 +725,6 @@ class ImprovedTextileWorldScraper:
                 logger.info(f"Attempting direct navigation to: {next_url}")
                 
                 self.driver.get(next_url)
-                time.sleep(2)
                 
                 # Verify we got a valid page
                 if self.verify_valid_page():
@@ -316,92 +782,37 @@ class ImprovedTextileWorldScraper:
         current_page = self.get_current_page_number()
         target_page = current_page + 1 if current_page else 2
         
-        for selector in next_selectors:
+        try:
+            candidates = self.driver.execute_script(NEXT_BUTTON_CANDIDATES_SCRIPT, next_selectors, target_page)
+        except Exception as e:
+            logger.debug(f"Error finding next buttons: {e}")
+            return False
+        
+        for candidate in candidates:
             try:
-                if ":contains(" in selector:
-                    # Handle jQuery-style selectors
-                    text = selector.split("'")[1] if "'" in selector else selector.split('"')[1]
-                    elements = self.driver.find_elements(By.XPATH, f"//a[contains(text(), '{text}')]")
+                logger.info(f"Found valid next button: {candidate['text']} -> {candidate['href']}")
+                
+                if candidate['href']:
+                    # A real link: load it directly rather than scrolling to it and clicking
+                    self.driver.get(candidate['href'])
                 else:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                    self.driver.execute_script("arguments[0].click();", candidate['element'])
+                    
+                    # Wait for the old page to go away before checking the new one
+                    try:
+                        WebDriverWait(self.driver, PAGE_LOAD_TIMEOUT).until(EC.staleness_of(candidate['element']))
+                    except TimeoutException:
+                        pass  # AJAX pagination swaps the grid without unloading the page
                 
-                for element in elements:
-                    if self.is_valid_textileworld_next_button(element, target_page):
-                        try:
-                            logger.info(f"Found valid next button: {element.text} -> {element.get_attribute('href')}")
-                            
-                            # Scroll to element
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                            time.sleep(1)
-                            
-                            # Click the button
-                            self.driver.execute_script("arguments[0].click();", element)
-                            time.sleep(2)
-                            
-                            if self.verify_valid_page():
-                                return True
-                                
-                        except Exception as e:
-                            logger.debug(f"Error clicking button: {e}")
-                            continue
-                            
+                if self.verify_valid_page():
+                    return True
+                    
             except Exception as e:
-                logger.debug(f"Error with selector {selector}: {e}")
+                logger.debug(f"Error following next button: {e}")
                 continue
         
         return False
 
-    def is_valid_textileworld_next_button(self, element, target_page):
-        """Check if element is a valid next button for TextileWorld.eu"""
-        try:
-            if not (element.is_displayed() and element.is_enabled()):
-                return False
-            
-            text = element.text.strip()
-            href = element.get_attribute("href")
-            title = (element.get_attribute("title") or "").lower()
-            classes = (element.get_attribute("class") or "").lower()
-            
-            # Skip disabled buttons
-            if "disabled" in classes or element.get_attribute("disabled"):
-                return False
-            
-            # Skip javascript void links
-            if href and ("javascript:" in href or href == "#"):
-                return False
-            
-            # Check for "next" indicators (English/German)
-            next_indicators = [
-                "next" in text.lower(),
-                "weiter" in text.lower(),
-                "nächste" in text.lower(),
-                "next" in title,
-                "weiter" in title,
-                text in [">", "»", "→"]
-            ]
-            
-            # Check for numeric pagination
-            if text.isdigit() and int(text) == target_page:
-                next_indicators.append(True)
-            
-            # Check URL contains next page number
-            if href and f"/p/{target_page}/" in href:
-                next_indicators.append(True)
-            
-            # Avoid previous buttons
-            prev_indicators = [
-                "previous" in text.lower(),
-                "zurück" in text.lower(),
-                "vorherige" in text.lower(),
-                text in ["<", "«", "←"]
-            ]
-            
-            return any(next_indicators) and not any(prev_indicators)
-            
-        except Exception as e:
-            logger.debug(f"Error validating TextileWorld button: {e}")
-            return False
-
     def analyze_textileworld_pagination(self):
         """Analyze TextileWorld.eu pagination structure"""
         logger.info("\n=== TEXTILEWORLD.EU PAGINATION ANALYSIS ===")
@@ -414,28 +825,22 @@ class ImprovedTextileWorldScraper:
             ".page-numbers"
         ]
         
-        for selector in pagination_selectors:
-            try:
-                containers = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for container in containers:
-                    if container.is_displayed():
-                        logger.info(f"Found pagination container: {selector}")
-                        html = container.get_attribute('outerHTML')
-                        logger.info(f"  HTML: {html[:300]}...")
-                        
-                        # Look for all links
-                        links = container.find_elements(By.TAG_NAME, "a")
-                        logger.info(f"  Found {len(links)} pagination links:")
-                        for link in links:
-                            text = link.text.strip()
-                            href = link.get_attribute("href")
-                            title = link.get_attribute("title")
-                            logger.info(f"    Text: '{text}', Title: '{title}', Href: {href}")
-                        
-                        return
-                        
-            except Exception as e:
-                continue
+        try:
+            pagination = self.driver.execute_script(PAGINATION_INFO_SCRIPT, pagination_selectors)
+        except Exception as e:
+            pagination = None
+        
+        if pagination:
+            logger.info(f"Found pagination container: {pagination['selector']}")
+            logger.info(f"  HTML: {pagination['html'][:300]}...")
+            
+            # Look for all links
+            links = pagination['links']
+            logger.info(f"  Found {len(links)} pagination links:")
+            for link in links:
+                logger.info(f"    Text: '{link['text']}', Title: '{link['title']}', Href: {link['href']}")
+            
+            return
         
         logger.warning("No pagination container found")
 
@@ -443,27 +848,13 @@ class ImprovedTextileWorldScraper:
         """Verify we're on a valid product page"""
         try:
             # Wait for page to load
-            time.sleep(2)
+            self.wait_for_products()
             
             # Check for common indicators of a valid product page
-            indicators = [
-                # Product containers
-                ".products-grid",
-                ".product-items",
-                ".category-products",
-                ".search-results",
-                
-                # At least one product
-                ".product-item",
-                ".item",
-                "[data-product-id]"
-            ]
-            
-            for indicator in indicators:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, indicator)
-                if elements and any(el.is_displayed() for el in elements):
-                    logger.info(f"Valid page confirmed - found {indicator}")
-                    return True
+            indicator = self.driver.execute_script(FIRST_VISIBLE_SELECTOR_SCRIPT, VALID_PAGE_INDICATORS)
+            if indicator:
+                logger.info(f"Valid page confirmed - found {indicator}")
+                return True
             
             # Check if we got an error page
             error_indicators = [
@@ -491,8 +882,7 @@ class ImprovedTextileWorldScraper:
         try:
             # Method 1: From URL
             url = self.driver.current_url
-            import re
-            page_match = re.search(r'/p/(\d+)/', url)
+            page_match = PAGE_IN_URL_RE.search(url)
             if page_match:
                 return int(page_match.group(1))
             
@@ -538,69 +928,97 @@ class ImprovedTextileWorldScraper:
         
         return False
     
-    def count_products_on_current_page(self):
-        """Count products on the current page using multiple methods"""
+    def count_products_on_current_page(self, html=None):
+        """Count products on the current page using multiple methods.
+        
+        Counting runs in the browser, so only the counts cross WebDriver. Pass the
+        page source when the caller already has it to count mentions in it instead.
+        """
         counts = []
         
-        # Method 1: Product links
-        product_link_selectors = [
-            "a[href*='html']",
-            "a[title]",
-            ".product-item a",
-            ".product a",
-            "a[href*='product']"
-        ]
+        try:
+            result = self.driver.execute_script(PRODUCT_COUNT_SCRIPT, PRODUCT_LINK_SELECTORS,
+                                                BRAND_RE.pattern, BRAND_MENTION_RE.pattern, html is None)
+        except:
+            result = {'link_counts': [], 'mentions': None}
         
-        for selector in product_link_selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                # Filter for actual product links
-                product_count = 0
-                for elem in elements:
-                    href = elem.get_attribute("href") or ""
-                    title = elem.get_attribute("title") or ""
-                    text = elem.text or ""
-                    
-                    # Check if this looks like a product
-                    combined_text = (href + " " + title + " " + text).lower()
-                    if any(brand in combined_text for brand in ['jack', 'jones', 'morning', 'soya', 'selected']):
-                        product_count += 1
-                
-                if product_count > 0:
-                    counts.append(product_count)
-                    
-            except:
-                continue
+        # Method 1: Product links (those that look like a product)
+        for product_count in result['link_counts']:
+            if product_count > 0:
+                counts.append(product_count)
         
         # Method 2: Text-based counting
-        try:
-            page_text = self.driver.page_source.lower()
-            brand_mentions = 0
-            brands = ['jack & jones', 'jack&jones', 'new morning', 'soyaconcept', 'selected homme']
-            for brand in brands:
-                brand_mentions += page_text.count(brand)
-            
-            if brand_mentions > 0:
-                counts.append(brand_mentions // 2)  # Divide by 2 to account for duplicates
-        except:
-            pass
+        brand_mentions = result['mentions']
+        if html is not None:
+            brand_mentions = len(BRAND_MENTION_RE.findall(html.lower()))
+        
+        if brand_mentions:
+            counts.append(brand_mentions // 2)  # Divide by 2 to account for duplicates
         
         final_count = max(counts) if counts else 0
         logger.info(f"Product count methods: {counts} -> Final: {final_count}")
         return final_count
     
-    def extract_products_from_current_page(self):
-        """Extract all products from the current page"""
+    def extract_products_from_current_page(self, html=None):
+        """Extract all products from the current page, reusing its source if already fetched"""
         logger.info("Extracting products from current page...")
+        if html is None:
+            html = self.driver.page_source
+        return self.extract_products_from_html(html, self.driver.current_url)
+    
+    def parse_html(self, html):
+        """Parse listing HTML with the fast lxml backend, falling back to html.parser.
         
+        The whole page is kept: product cards come as div/li/a depending on the
+        theme, the price search walks up through their parents, and the
+        collateral box is looked up by id.
+        """
+        try:
+            return BeautifulSoup(html, 'lxml')
+        except FeatureNotFound:
+            return BeautifulSoup(html, 'html.parser')
+    
+    def extract_products_from_html(self, html, source_page):
+        """Extract all products from a page's HTML"""
         products = []
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+        soup = self.parse_html(html)
+        
+        # Element ids are unique, so the collateral box (and its text) is the
+        # same for every product on the page; read it once. Interned so every
+        # page with the same box shares one string instead of a copy per page
+        collateral_elem = soup.find(id='collateral-box')
+        collateral_text = sys.intern(collateral_elem.get_text(strip=True)) if collateral_elem else ''
+        
+        # Map each link to the text of its nearest enclosing .product-info in one
+        # top-down pass; inner containers come later in document order and win
+        link_product_info = {}
+        for product_info_elem in soup.select('.product-info'):
+            product_info_text = product_info_elem.get_text(strip=True)
+            for link in product_info_elem.find_all('a', href=True):
+                link_product_info[id(link)] = product_info_text
+        
+        # Strategy 1: Find all links and filter for products. Listing pages keep
+        # them in the product grid, so only walk that when the page has one
+        grids = []
+        for selector in PRODUCT_GRID_CONTAINERS:
+            grids = soup.select(selector)
+            if grids:
+                break
+        
+        if grids:
+            all_links = [link for grid in grids for link in grid.find_all('a', href=True)]
+        else:
+            all_links = soup.find_all('a', href=True)
         
-        # Strategy 1: Find all links and filter for products
-        all_links = soup.find_all('a', href=True)
+        # Hrefs that already produced a product; the image, title and "buy" links
+        # of one product all point to the same place
+        seen_hrefs = set()
         
         for link in all_links:
             href = link.get('href', '')
+            if href in seen_hrefs:
+                continue
+            
             title = link.get('title', '')
             text = link.get_text(strip=True)
             
@@ -608,18 +1026,14 @@ class ImprovedTextileWorldScraper:
             combined_text = (href + " " + title + " " + text).lower()
             
             # Brand detection
-            has_brand = any(brand in combined_text for brand in [
-                'jack', 'jones', 'morning', 'soya', 'selected'
-            ])
+            has_brand = BRAND_RE.search(combined_text) is not None
             
             if has_brand and len(text) > 3:
-                # Find product-info element
-                product_info_elem = link.find_parent(class_='product-info') or link.find(class_='product-info')
-                product_info_text = product_info_elem.get_text(strip=True) if product_info_elem else ''
-                
-                # Find collateral-box element
-                collateral_elem = link.find_parent(id='collateral-box') or soup.find(id='collateral-box')
-                collateral_text = collateral_elem.get_text(strip=True) if collateral_elem else ''
+                # Find product-info element (enclosing, else inside the link)
+                product_info_text = link_product_info.get(id(link))
+                if product_info_text is None:
+                    product_info_elem = link.find(class_='product-info')
+                    product_info_text = product_info_elem.get_text(strip=True) if product_info_elem else ''
                 
                 # Extract product data
                 product_data = {
@@ -628,27 +1042,25 @@ class ImprovedTextileWorldScraper:
                     'price': self.find_price_near_element_bs4(link, soup),
                     'product': product_info_text,  # New element: class='product-info'
                     'id': collateral_text,         # New element: id='collateral-box'
-                    'source_page': self.driver.current_url,
+                    'source_page': source_page,
                     'raw_text': text[:100]
                 }
-                print(product_data)
+                logger.debug("product: %s", product_data)
                 
                 # Validate and clean
                 if self.is_valid_product(product_data):
                     products.append(product_data)
+                    seen_hrefs.add(href)
         
         # Strategy 2: Look for structured product data
         product_containers = soup.select('.product-item, .item, [data-product-id]')
         for container in product_containers:
-            product_data = self.extract_from_container_bs4(container)
+            product_data = self.extract_from_container_bs4(container, source_page)
             if product_data and self.is_valid_product(product_data):
                 # Add the new elements to container-extracted products as well
                 product_info_elem = container.find(class_='product-info')
                 product_info_text = product_info_elem.get_text(strip=True) if product_info_elem else ''
                 
-                collateral_elem = soup.find(id='collateral-box')
-                collateral_text = collateral_elem.get_text(strip=True) if collateral_elem else ''
-                
                 product_data['product'] = product_info_text
                 product_data['id'] = collateral_text
                 
@@ -673,17 +1085,10 @@ class ImprovedTextileWorldScraper:
             else:
                 break
         
-        price_patterns = [
-            r'(\d+[.,]\d{2})\s*€',
-            r'€\s*(\d+[.,]\d{2})',
-            r'\b(\d+[.,]\d{2})\b',
-            r'(\d{1,4}[.,]\d{2})',
-        ]
-        
         for search_elem in search_elements:
             text = search_elem.get_text() if hasattr(search_elem, 'get_text') else str(search_elem)
-            for pattern in price_patterns:
-                match = re.search(pattern, text)
+            for pattern in PRICE_PATTERNS:
+                match = pattern.search(text)
                 if match:
                     price = match.group(1).replace(',', '.')
                     try:
@@ -695,7 +1100,7 @@ class ImprovedTextileWorldScraper:
         
         return ""
     
-    def extract_from_container_bs4(self, container):
+    def extract_from_container_bs4(self, container, source_page):
         """Extract product data from a container element"""
         try:
             # Find product name
@@ -725,7 +1130,7 @@ class ImprovedTextileWorldScraper:
                 'name': name,
                 'url': url,
                 'price': price,
-                'source_page': self.driver.current_url,
+                'source_page': source_page,
                 'extraction_method': 'container'
             }
         except:
@@ -739,24 +1144,33 @@ class ImprovedTextileWorldScraper:
             return False
         
         # Check for brand indicators
-        name_lower = name.lower()
-        has_brand = any(brand in name_lower for brand in [
-            'jack', 'jones', 'morning', 'soya', 'selected'
-        ])
+        has_brand = BRAND_RE.search(name.lower()) is not None
         
         return has_brand
     
+    def product_key(self, product):
+        """Identity of a product: its URL (or the normalised name when there is none); None if too vague"""
+        url = product.get('url', '').strip()
+        if url:
+            # Query strings and fragments (tracking, colour anchors) don't make a new product
+            return urlsplit(url)._replace(query='', fragment='').geturl()
+        
+        # Create normalized key from the name
+        name = product.get('name', '').strip()
+        key = NON_WORD_RE.sub('', name.lower()).replace(' ', '')
+        return key if len(key) > 3 else None
+    
     def deduplicate_products(self, products):
-        """Remove duplicate products"""
+        """Remove duplicate products, keyed on product_key"""
         seen = set()
         unique_products = []
         
         for product in products:
-            name = product.get('name', '').strip()
-            # Create normalized key
-            key = re.sub(r'[^\w\s]', '', name.lower()).replace(' ', '')
+            key = self.product_key(product)
+            if key is None:
+                continue
             
-            if len(key) > 3 and key not in seen:
+            if key not in seen:
                 seen.add(key)
                 unique_products.append(product)
         
@@ -805,14 +1219,19 @@ class ImprovedTextileWorldScraper:
         
         last_count = 0
         stable_count = 0
+        self.driver.execute_script(RESET_NEW_NODES_SCRIPT)
         
         for attempt in range(20):
-            # Scroll down
+            # Scroll down and wait until new nodes appear (or give up after a few seconds)
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            content_added = self.wait_for_more_content()
             
-            # Count products
-            current_count = self.count_products_on_current_page()
+            # Count products, unless nothing was added since the last count
+            if attempt == 0 or content_added:
+                self.driver.execute_script(RESET_NEW_NODES_SCRIPT)
+                current_count = self.count_products_on_current_page()
+            else:
+                current_count = last_count
             
             if current_count > last_count:
                 logger.info(f"Scroll {attempt + 1}: Found {current_count} products (+{current_count - last_count})")
@@ -834,30 +1253,16 @@ class ImprovedTextileWorldScraper:
     
     def trigger_load_more_buttons(self):
         """Find and click load more buttons"""
-        selectors = [
-            "button:contains('Load More')",
-            "button:contains('Show More')",
-            ".load-more",
-            ".show-more",
-            "button[class*='load']"
-        ]
-        
-        for selector in selectors:
-            try:
-                if 'contains(' in selector:
-                    text = selector.split("'")[1]
-                    elements = self.driver.find_elements(By.XPATH, f"//button[contains(text(), '{text}')]")
-                else:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                
-                for element in elements:
-                    if element.is_displayed() and element.is_enabled():
-                        logger.info(f"Clicking load more button: {element.text}")
-                        self.driver.execute_script("arguments[0].click();", element)
-                        time.sleep(3)
-                        return True
-            except:
-                continue
+        try:
+            element = self.driver.execute_script(LOAD_MORE_BUTTON_SCRIPT, LOAD_MORE_XPATHS)
+            
+            if element is not None:
+                logger.info(f"Clicking load more button: {element.text}")
+                self.driver.execute_script("arguments[0].click();", element)
+                self.wait_for_more_content()
+                return True
+        except:
+            pass
         
         return False
     
@@ -872,18 +1277,21 @@ class ImprovedTextileWorldScraper:
         # Save CSV
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
             fieldnames = ['name', 'price', 'url', 'source_page', 'extraction_method', 'raw_text']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for product in products:
-                # Ensure all required fields exist
-                row = {field: product.get(field, '') for field in fieldnames}
-                writer.writerow(row)
-        
-        # Save JSON
+            # Positional rows straight from the product dicts; missing fields are
+            # written as '' and extra keys are skipped
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerows([product.get(field, '') for field in fieldnames] for product in products)
+        
+        # Save JSON. With indent, the stdlib encoder drops to its pure-Python
+        # path, so prefer orjson when it's installed
         json_filename = filename.replace('.csv', '.json')
-        with open(json_filename, 'w', encoding='utf-8') as jsonfile:
-            json.dump(products, jsonfile, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(json_filename, 'wb') as jsonfile:
+                jsonfile.write(orjson.dumps(products, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_filename, 'w', encoding='utf-8') as jsonfile:
+                json.dump(products, jsonfile, indent=2, ensure_ascii=False)
         
         logger.info(f"✓ Results saved to: {filename} and {json_filename}")
         return filename
@@ -901,7 +1309,7 @@ class ImprovedTextileWorldScraper:
             # Load initial page
             logger.info("Loading initial page...")
             self.driver.get(url)
-            time.sleep(5)
+            self.wait_for_products()
             
             # Use smart scraping approach
             products = self.smart_scraping_approach()
@@ -939,12 +1347,21 @@ class ImprovedTextileWorldScraper:
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Scrape TextileWorld.eu product listings")
+    parser.add_argument('--debug', action='store_true',
+                        help="Show the browser window and wait for Enter before exiting")
+    parser.add_argument('--browser-workers', type=int, default=1,
+                        help="Chrome instances for URL pagination when the pages need a browser (max 8)")
+    args = parser.parse_args()
+    
     url = "https://www.textileworld.eu/catalogsearch/result/index/adjclear/true/"
     
-    # Create scraper instance
+    # Create scraper instance; headless unless debugging, since rendering the
+    # window costs time on every page
     scraper = ImprovedTextileWorldScraper(
-        headless=False,  # Keep False for debugging
-        target_count=3000
+        headless=not args.debug,
+        target_count=3000,
+        browser_workers=args.browser_workers
     )
     
     # Run scraper
@@ -955,7 +1372,8 @@ def main():
     else:
         print("\n❌ SCRAPING FAILED - Check logs for details")
     
-    input("\nPress Enter to exit...")
+    if args.debug:
+        input("\nPress Enter to exit...")
 
 if __name__ == "__main__":
     main()
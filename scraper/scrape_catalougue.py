@@ -1,5 +1,6 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer, FeatureNotFound
 
 url = "https://www.textileworld.eu"
 
@@ -7,29 +8,57 @@ headers = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 }
 
+# Reuse one kept-alive connection pool for every request made through the session
+session = requests.Session()
+session.headers.update(headers)
+adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+session.mount('https://', adapter)
+session.mount('http://', adapter)
+
+# Only build the elements we read; the rest of the page is skipped by the parser
+strainer = SoupStrainer(class_=['product-info', 'price', 'collateral-box'])
+
 try:
     # Fetch the page
-    response = requests.get(url, headers=headers)
+    response = session.get(url)
     response.raise_for_status()  # Check for HTTP errors
     
-    soup = BeautifulSoup(response.text, 'html.parser')
-
+    try:
+        soup = BeautifulSoup(response.text, 'lxml', parse_only=strainer)
+    except FeatureNotFound:
+        soup = BeautifulSoup(response.text, 'html.parser', parse_only=strainer)
+    
+    # Pick the first div.product-info, span.price and div.collateral-box in one traversal
+    found = {}
+    for element in soup.find_all(['div', 'span'], class_=['product-info', 'price', 'collateral-box']):
+        classes = element.get('class', [])
+        if element.name == 'div' and 'product-info' in classes:
+            found.setdefault('product-info', element)
+        if element.name == 'span' and 'price' in classes:
+            found.setdefault('price', element)
+        if element.name == 'div' and 'collateral-box' in classes:
+            found.setdefault('collateral-box', element)
+    
     # Extract catalogue number (updated selectors)
-    catalogue_number = soup.find('div', {'class': 'product-info'})
+    catalogue_number = found.get('product-info')
     print(catalogue_number)
     if catalogue_number:
         print('yes')
-        article_number = soup.find('div', class_='product-info').text.strip()
+        article_number = catalogue_number.text.strip()
     else:
         catalogue_number = "Not found"
     
     # Extract price (updated selectors)
-    price = soup.find('span', {'class': 'price'})
+    price = found.get('price')
     if price:
         price = price.text.strip()
     else:
         price = "Not found"
-    article_name = soup.find('div', class_='collateral-box').text.strip()
+    article_name = found.get('collateral-box')
+    if article_name:
+        article_name = article_name.text.strip()
+    else:
+        article_name = "Not found"
     
     print(f"Catalogue Number: {article_number}")
     print(f"Price: {price}")
@@ -2,70 +2,105 @@ import fitz
 import os
 import re
 import csv
+import mmap
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
-def extract_images_with_pattern(pdf_path, output_folder, pattern=r'\d+\.\d+\s*\|', min_size=200):
+_LEADING_DOT_RE = re.compile(r'^[\.\s]+')
+
+# Don't echo every MuPDF complaint about malformed images to stderr; they're
+# still collected in fitz.TOOLS.mupdf_warnings(). Runs at import, so in every
+# pool worker too
+fitz.TOOLS.mupdf_display_errors(False)
+
+# Document opened once per worker process by _init_worker
+_DOC = None
+
+# Images (xrefs) placed on more than one page, e.g. template artwork, and the
+# encoded PNGs of those already decoded by this worker: (png, width, height)
+_SHARED_XREFS = frozenset()
+_PNG_CACHE = {}
+
+def _init_worker(pdf_path, shared_xrefs=frozenset()):
+    """Open the PDF once per worker so pages don't re-parse the file.
+    
+    The file is memory-mapped read-only, so the workers share a single copy
+    through the OS page cache rather than each reading it into its own buffer.
     """
-    Extract images from PDF that have text matching the specified pattern underneath.
+    global _DOC, _SHARED_XREFS
+    _SHARED_XREFS = shared_xrefs
+    with open(pdf_path, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    _DOC = fitz.open(stream=memoryview(data), filetype='pdf')
+
+def _process_page(page_num, pattern, output_folder, min_size):
+    """Save the images of a single (0-based) page whose caption matches the compiled pattern.
     
-    Args:
-        pdf_path: Path to the PDF file
-        output_folder: Directory to save extracted images
-        pattern: Regex pattern to match (default matches '16.1426 |' style patterns)
-        min_size: Minimum width/height in pixels (default 200)
+    Returns their CSV rows.
     """
-    doc = fitz.open(pdf_path)
-    os.makedirs(output_folder, exist_ok=True)
+    page = _DOC.load_page(page_num)
+    images = page.get_images(full=True)
+    if not images:
+        return []
     
-    total_extracted = 0
-    extracted_data = []  # Store data for CSV
+    # Get all text blocks with their positions
+    # block format: (x0, y0, x1, y1, "text", block_no, block_type)
+    text_blocks = page.get_text("blocks")
+    
+    # Index the blocks by their top edge so each image only looks at the blocks
+    # starting in the 50 units below it, instead of scanning the whole page
+    indexed_blocks = sorted(
+        (block[1], block_num, block[0], block[4].strip())
+        for block_num, block in enumerate(text_blocks) if len(block) >= 5
+    )
+    block_tops = [block[0] for block in indexed_blocks]
+    
+    page_rows = []
     
-    for page_num, page in enumerate(doc):
-        images = page.get_images(full=True)
-        if not images:
+    for img_index, img in enumerate(images):
+        xref = img[0]
+        
+        # Get image rectangle on the page
+        img_rects = page.get_image_rects(xref)
+        if not img_rects:
             continue
+            
+        img_rect = img_rects[0]  # Use first occurrence of image
         
-        # Get all text blocks with their positions
-        text_blocks = page.get_text("blocks")
+        # Look for text blocks below the image; keep the first matching one
+        # in page order. The window is a unit wider than needed so rounding
+        # never drops a block; the exact test below still applies
+        matching_text = None
         
-        page_extracted = 0
+        window = indexed_blocks[bisect_right(block_tops, img_rect.y1):bisect_left(block_tops, img_rect.y1 + 51)]
+        for y0, block_num, x0, text_content in sorted(window, key=lambda block: block[1]):
+            # Check if text block is below the image (y-coordinate is greater)
+            # and horizontally overlaps or is close to the image
+            if (y0 > img_rect.y1 and  # Text is below image
+                abs(x0 - img_rect.x0) < 100 and  # Horizontally aligned (within 100 units)
+                y0 - img_rect.y1 < 50):  # Text is close to image (within 50 units)
+                
+                # Check if text matches the pattern
+                if pattern.search(text_content):
+                    matching_text = text_content
+                    print(f"✓ Found matching text: '{text_content}'")
+                    break
         
-        for img_index, img in enumerate(images):
-            xref = img[0]
-            
-            # Get image rectangle on the page
-            img_rects = page.get_image_rects(xref)
-            if not img_rects:
+        # Extract and save the image if pattern was found
+        if matching_text is not None:
+            # Check minimum size requirement from the image's own dimensions
+            # (img[2], img[3]) before paying for the decode
+            width, height = img[2], img[3]
+            if width < min_size or height < min_size:
+                print(f"⚠️ Skipping small image {img_index + 1} on page {page_num + 1}: {width}x{height}px (min: {min_size}x{min_size}px)")
                 continue
-                
-            img_rect = img_rects[0]  # Use first occurrence of image
-            
-            # Look for text blocks below the image
-            matching_text_found = False
-            
-            for block in text_blocks:
-                # block format: (x0, y0, x1, y1, "text", block_no, block_type)
-                if len(block) < 5:
-                    continue
-                    
-                text_rect = fitz.Rect(block[0], block[1], block[2], block[3])
-                text_content = block[4].strip()
-                
-                # Check if text block is below the image (y-coordinate is greater)
-                # and horizontally overlaps or is close to the image
-                if (text_rect.y0 > img_rect.y1 and  # Text is below image
-                    abs(text_rect.x0 - img_rect.x0) < 100 and  # Horizontally aligned (within 100 units)
-                    text_rect.y0 - img_rect.y1 < 50):  # Text is close to image (within 50 units)
-                    
-                    # Check if text matches the pattern
-                    if re.search(pattern, text_content):
-                        matching_text_found = True
-                        print(f"✓ Found matching text: '{text_content.strip()}'")
-                        break
             
-            # Extract and save the image if pattern was found
-            if matching_text_found:
-                try:
-                    pix = fitz.Pixmap(doc, xref)
+            try:
+                # Images repeated across pages are decoded and encoded once per worker
+                encoded = _PNG_CACHE.get(xref)
+                if encoded is None:
+                    pix = fitz.Pixmap(_DOC, xref)
                     
                     # Handle CMYK or unsupported colorspaces
                     if pix.colorspace.n not in [1, 3]:  # not grayscale or RGB
@@ -75,75 +110,109 @@ def extract_images_with_pattern(pdf_path, output_folder, pattern=r'\d+\.\d+\s*\|
                             print(f"⚠️ Skipping image {img_index + 1} on page {page_num + 1}: {e}")
                             continue
                     
-                    # Check minimum size requirement
-                    if pix.width < min_size or pix.height < min_size:
-                        print(f"⚠️ Skipping small image {img_index + 1} on page {page_num + 1}: {pix.width}x{pix.height}px (min: {min_size}x{min_size}px)")
-                        continue
-                    
-                    # Save with unique filename
-                    output_path = os.path.join(output_folder, f"page_{page_num+1}_img_{img_index+1}.png")
-                    pix.save(output_path)
-                    print(f"✓ Saved image from page {page_num + 1}, image {img_index + 1} ({pix.width}x{pix.height}px)")
-                    
-                    # Parse the matching text to extract ID and name
-                    matching_text = ""
-                    for block in text_blocks:
-                        if len(block) < 5:
-                            continue
-                        text_rect = fitz.Rect(block[0], block[1], block[2], block[3])
-                        text_content = block[4].strip()
-                        
-                        if (text_rect.y0 > img_rect.y1 and 
-                            abs(text_rect.x0 - img_rect.x0) < 100 and 
-                            text_rect.y0 - img_rect.y1 < 50 and
-                            re.search(pattern, text_content)):
-                            matching_text = text_content
-                            break
-                    
-                    # Split text into ID and Name
-                    id_part = ""
-                    name_part = ""
-                    if '|' in matching_text:
-                        parts = matching_text.split('|', 1)  # Split only on first |
-                        id_part = parts[0].strip()
-                        # remove leading
-                        id_part = re.sub(r'^[\.\s]+', '', id_part).strip()
-                        name_part = parts[1].strip() if len(parts) > 1 else ""
-                    
-                    # Add to CSV data
-                    extracted_data.append({
-                        'page': page_num + 1,
-                        'image_index': img_index + 1,
-                        'filename': f"page_{page_num+1}_img_{img_index+1}.png",
-                        'width': pix.width,
-                        'height': pix.height,
-                        'full_text': matching_text,
-                        'id': id_part,
-                        'name': name_part
-                    })
-                    
-                    page_extracted += 1
-                    total_extracted += 1
-                    
-                except Exception as e:
-                    print(f"⚠️ Error processing image {img_index + 1} on page {page_num + 1}: {e}")
-        
-        if page_extracted > 0:
-            print(f"📄 Page {page_num + 1}: Extracted {page_extracted} images")
+                    encoded = (pix.tobytes("png"), pix.width, pix.height)
+                    if xref in _SHARED_XREFS:
+                        _PNG_CACHE[xref] = encoded
+                
+                png, pix_width, pix_height = encoded
+                
+                # Save with unique filename
+                output_path = os.path.join(output_folder, f"page_{page_num+1}_img_{img_index+1}.png")
+                with open(output_path, 'wb') as image_file:
+                    image_file.write(png)
+                print(f"✓ Saved image from page {page_num + 1}, image {img_index + 1} ({pix_width}x{pix_height}px)")
+                
+                # Split text into ID and Name
+                id_part = ""
+                name_part = ""
+                if '|' in matching_text:
+                    parts = matching_text.split('|', 1)  # Split only on first |
+                    id_part = parts[0].strip()
+                    # remove leading
+                    id_part = _LEADING_DOT_RE.sub('', id_part).strip()
+                    name_part = parts[1].strip() if len(parts) > 1 else ""
+                
+                # Add to CSV data
+                page_rows.append({
+                    'page': page_num + 1,
+                    'image_index': img_index + 1,
+                    'filename': f"page_{page_num+1}_img_{img_index+1}.png",
+                    'width': pix_width,
+                    'height': pix_height,
+                    'full_text': matching_text,
+                    'id': id_part,
+                    'name': name_part
+                })
+                
+            except Exception as e:
+                print(f"⚠️ Error processing image {img_index + 1} on page {page_num + 1}: {e}")
+    
+    return page_rows
+
+def extract_images_with_pattern(pdf_path, output_folder, pattern=r'\d+\.\d+\s*\|', min_size=200):
+    """
+    Extract images from PDF that have text matching the specified pattern underneath.
+    
+    Pages are processed in parallel across a process pool.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        output_folder: Directory to save extracted images
+        pattern: Regex pattern to match (default matches '16.1426 |' style patterns)
+        min_size: Minimum width/height in pixels (default 200)
+    """
+    os.makedirs(output_folder, exist_ok=True)
+    
+    total_extracted = 0
+    
+    # Rows are written to the CSV as each page comes back, so nothing piles up
+    # in memory and a killed run still leaves the pages it finished. The file
+    # is only created once there is a row to write
+    csv_path = os.path.join(output_folder, "extracted_images.csv")
+    fieldnames = ['page', 'image_index', 'filename', 'width', 'height', 'full_text', 'id', 'name']
+    csvfile = None
+    
+    # Find the images placed on more than one page, so workers know which
+    # decoded images are worth keeping; listing images doesn't decode them
+    with fitz.open(pdf_path) as doc:
+        page_count = doc.page_count
+        seen_xrefs = set()
+        shared_xrefs = set()
+        for page_num in range(page_count):
+            for img in doc.get_page_images(page_num, full=True):
+                if img[0] in seen_xrefs:
+                    shared_xrefs.add(img[0])
+                seen_xrefs.add(img[0])
+    
+    # Pixmap decoding and PNG encoding are CPU-bound, so spread the pages over
+    # processes; rows come back in page order. The pattern is compiled once
+    # here and pickles to the workers
+    process_page = partial(_process_page, pattern=re.compile(pattern), output_folder=output_folder, min_size=min_size)
+    try:
+        with ProcessPoolExecutor(initializer=_init_worker,
+                                 initargs=(pdf_path, frozenset(shared_xrefs))) as executor:
+            for page_num, page_rows in enumerate(executor.map(process_page, range(page_count))):
+                if not page_rows:
+                    continue
+                
+                if csvfile is None:
+                    csvfile = open(csv_path, 'w', newline='', encoding='utf-8')
+                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+                    writer.writeheader()
+                
+                writer.writerows(page_rows)
+                csvfile.flush()
+                total_extracted += len(page_rows)
+                
+                print(f"📄 Page {page_num + 1}: Extracted {len(page_rows)} images")
+    finally:
+        if csvfile is not None:
+            csvfile.close()
     
     print(f"\n🎯 Total images extracted: {total_extracted}")
     
-    # Save CSV file
-    if extracted_data:
-        csv_path = os.path.join(output_folder, "extracted_images.csv")
-        with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['page', 'image_index', 'filename', 'width', 'height', 'full_text', 'id', 'name']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(extracted_data)
+    if total_extracted:
         print(f"💾 CSV data saved to: {csv_path}")
-    
-    doc.close()
 
 def extract_images_with_custom_pattern(pdf_path, output_folder, custom_pattern, min_size=200):
     """
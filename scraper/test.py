@@ -9,13 +9,202 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException
+from bs4 import BeautifulSoup, FeatureNotFound
 import logging
 
+try:
+    import orjson  # Much faster JSON encoding, including indented output
+except ImportError:
+    orjson = None
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Price patterns tried in order of confidence, compiled once at import
+PRICE_PATTERNS = tuple(re.compile(p) for p in (
+    r'(\d+[.,]\d{2})\s*€',
+    r'€\s*(\d+[.,]\d{2})',
+    r'\$\s*(\d+[.,]\d{2})',
+    r'(\d+[.,]\d{2})\s*\$',
+    r'(\d{1,4}[.,]\d{2})',
+    r'(\d{1,4})\s*€',
+    r'€\s*(\d{1,4})',
+))
+NON_WORD_RE = re.compile(r'[^\w\s]')
+# Brand mentions as one case-insensitive alternation, so the page source is
+# scanned once rather than once per brand, and never copied to lowercase
+BRAND_MENTION_RE = re.compile(r'jack\s*&?\s*jones|new\s*morning|soyaconcept|selected\s*homme', re.IGNORECASE)
+
+# Links that may be products, counted by count_products_on_current_page
+PRODUCT_LINK_SELECTORS = [
+    "a[href*='.html']",
+    "a[title]",
+    ".product-item a",
+    ".product a",
+    "a[href*='product']",
+    ".item a"
+]
+BRAND_KEYWORDS = ['jack', 'jones', 'morning', 'soya', 'selected']
+
+# Brand and navigation-item checks as single case-insensitive alternations, so
+# each string is scanned once rather than once per keyword. The longer brand
+# spellings (jackjones, jack&jones, soyaconcept) are covered by these
+BRAND_RE = re.compile('|'.join(BRAND_KEYWORDS), re.IGNORECASE)
+INVALID_NAME_RE = re.compile('search|menu|navigation|footer|header|login|register|cart|checkout|contact', re.IGNORECASE)
+
+# Per selector, how many elements have a brand in "href title text"; runs in
+# the browser so only the counts cross WebDriver, not every element's attributes
+PRODUCT_LINK_COUNT_SCRIPT = """
+var selectors = arguments[0], brands = arguments[1];
+return selectors.map(function (selector) {
+    return Array.from(document.querySelectorAll(selector)).filter(function (el) {
+        var text = ((el.href || '') + ' ' + (el.getAttribute('title') || '') + ' ' + (el.innerText || '')).toLowerCase();
+        return brands.some(function (brand) { return text.indexOf(brand) !== -1; });
+    }).length;
+});
+"""
+
+# Number of BRAND_MENTION_RE matches in the serialised page, counted in the
+# browser so the multi-MB page source doesn't have to cross WebDriver
+BRAND_MENTION_COUNT_SCRIPT = """
+var matches = document.documentElement.outerHTML.match(new RegExp(arguments[0], 'gi'));
+return matches ? matches.length : 0;
+"""
+
+# Load more / next page candidates: either a tag whose text contains a phrase
+# (lowercased first when ignore_case is set) or a CSS selector
+LOAD_MORE_RULES = [
+    # Common button texts
+    {'tag': 'button', 'text': 'load more', 'ignore_case': True},
+    {'tag': 'button', 'text': 'show more', 'ignore_case': True},
+    {'tag': 'button', 'text': 'more products', 'ignore_case': True},
+    {'tag': 'a', 'text': 'load more', 'ignore_case': True},
+    
+    # Common CSS classes and IDs
+    {'css': ".load-more"},
+    {'css': ".show-more"},
+    {'css': ".load-more-products"},
+    {'css': ".btn-load-more"},
+    {'css': "#load-more"},
+    {'css': "#show-more"},
+    {'css': "[data-role='load-more']"},
+    {'css': "[data-action='load-more']"},
+    
+    # Generic button patterns
+    {'css': "button[class*='load']"},
+    {'css': "button[class*='more']"},
+    {'css': "a[class*='load']"},
+    {'css': "a[class*='more']"}
+]
+NEXT_PAGE_RULES = [
+    # Text-based matching
+    {'tag': 'a', 'text': 'next', 'ignore_case': True},
+    {'tag': 'button', 'text': 'next', 'ignore_case': True},
+    {'tag': 'a', 'text': '>'},
+    {'tag': 'a', 'text': '→'},
+    {'tag': 'a', 'text': '»'},
+    
+    # Attribute-based selectors
+    {'css': "a[title*='Next' i]"},
+    {'css': "a[aria-label*='Next' i]"},
+    {'css': "button[title*='Next' i]"},
+    {'css': "button[aria-label*='Next' i]"},
+    
+    # Class-based selectors
+    {'css': ".next"},
+    {'css': ".next-page"},
+    {'css': ".pagination-next"},
+    {'css': ".pager-next a"},
+    {'css': ".page-next"},
+    
+    # Generic pagination patterns
+    {'css': ".pagination a[href*='p=']"},
+    {'css': ".pagination a[href*='page=']"},
+    {'css': ".pager a[href*='p=']"},
+    
+    # ID-based selectors
+    {'css': "#next-page"},
+    {'css': "#pagination-next"}
+]
+
+# For each rule, the first visible and enabled element it matches (or null).
+# Text rules filter a single scan of the page's links and buttons instead of
+# running a translate() XPath over the whole DOM per phrase. With arguments[1]
+# set, only links with a real (non javascript:) href count
+CLICKABLE_CANDIDATES_SCRIPT = """
+var rules = arguments[0], needHref = arguments[1];
+var clickables = Array.from(document.querySelectorAll('a, button'));
+
+function usable(e) {
+    if (!(e.offsetWidth || e.offsetHeight || e.getClientRects().length) || e.disabled) return false;
+    if (!needHref) return true;
+    var href = e.getAttribute('href') === null ? null : e.href;
+    return !!href && href.indexOf('javascript:') === -1;
+}
+
+return rules.map(function (rule) {
+    var elements;
+    if (rule.text) {
+        elements = clickables.filter(function (e) {
+            if (e.tagName.toLowerCase() !== rule.tag) return false;
+            var text = e.textContent || '';
+            return (rule.ignore_case ? text.toLowerCase() : text).indexOf(rule.text) !== -1;
+        });
+    } else {
+        try { elements = document.querySelectorAll(rule.css); } catch (err) { return null; }
+    }
+    for (var i = 0; i < elements.length; i++) {
+        if (usable(elements[i])) return elements[i];
+    }
+    return null;
+});
+"""
+
+# Page height and number of elements matching the selector in arguments[0]
+# (PRODUCT_ITEM_SELECTOR) in one round-trip; cheap enough to check after every
+# scroll, unlike the full page source scan
+SCROLL_STATE_SCRIPT = """
+return [document.body.scrollHeight, document.querySelectorAll(arguments[0]).length];
+"""
+
+# Scrolls to the bottom, waits arguments[0] ms for content to load, then
+# reports the same state as SCROLL_STATE_SCRIPT for the selector in
+# arguments[1], all in one async round-trip
+SCROLL_AND_WAIT_SCRIPT = """
+var done = arguments[arguments.length - 1], selector = arguments[1];
+window.scrollTo(0, document.body.scrollHeight);
+setTimeout(function () {
+    done([document.body.scrollHeight, document.querySelectorAll(selector).length]);
+}, arguments[0]);
+"""
+
+# Present once a listing page has rendered its products (TextileWorld renders
+# .listing-item rows)
+PRODUCT_GRID_SELECTOR = '.listing-item, .product-item, .products-grid, .item'
+# The product cards alone, without the grid wrapper, so the scroll loop's
+# count only goes up when products load, not when the grid (re)renders
+PRODUCT_ITEM_SELECTOR = '.listing-item, .product-item, .item'
+PAGE_LOAD_TIMEOUT = 10
+
+# With at least this many products from structured containers, a page isn't
+# scanned link by link as well
+MIN_CONTAINER_PRODUCTS = 10
+
+# Three small scrolls (200, 300, 400px) half a second apart, in one async round-trip
+INCREMENTAL_SCROLL_SCRIPT = """
+var done = arguments[arguments.length - 1], i = 0;
+(function step() {
+    window.scrollBy(0, 200 + i * 100);
+    if (++i >= 3) {
+        setTimeout(done, 500);
+        return;
+    }
+    setTimeout(step, 500);
+})();
+"""
+
 class ImprovedTextileWorldScraper:
     def __init__(self, headless=False, target_count=3000):
         self.target_count = target_count
@@ -37,6 +226,12 @@ class ImprovedTextileWorldScraper:
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        # Don't fetch or decode images; product thumbnails are never read.
+        # Stylesheets stay on: the button lookups depend on layout for visibility
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+        })
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
         
         if self.headless:
             chrome_options.add_argument("--headless=new")
@@ -44,41 +239,51 @@ class ImprovedTextileWorldScraper:
         try:
             self.driver = webdriver.Chrome(options=chrome_options)
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            self.driver.implicitly_wait(10)
             logger.info("✓ Chrome driver initialized successfully")
             return True
         except Exception as e:
             logger.error(f"✗ Driver setup failed: {e}")
             return False
     
-    def infinite_scroll_current_page(self):
-        """Perform infinite scrolling on the current page to load all products"""
+    def wait_for_products(self, timeout=PAGE_LOAD_TIMEOUT):
+        """Wait until the product grid is in the DOM; returns False on timeout"""
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, PRODUCT_GRID_SELECTOR))
+            )
+            return True
+        except TimeoutException:
+            logger.debug(f"No product grid after {timeout}s")
+            return False
+    
+    def infinite_scroll_current_page(self, current_total=0):
+        """Perform infinite scrolling on the current page to load all products.
+        
+        Stops early once the page shows enough products to reach the target on
+        top of the `current_total` already collected.
+        """
         logger.info("--- Starting infinite scroll on current page ---")
         
         # Get initial product count
         initial_count = self.count_products_on_current_page()
         logger.info(f"Initial products visible: {initial_count}")
         
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
-        last_product_count = initial_count
+        # The scroll loop only watches the cheap container count; the full
+        # multi-strategy count runs again once scrolling is done
+        last_height, last_product_count = self.driver.execute_script(SCROLL_STATE_SCRIPT, PRODUCT_ITEM_SELECTOR)
         stable_iterations = 0
         max_stable_iterations = 5
         
         for scroll_attempt in range(self.max_scroll_attempts):
-            # Scroll to bottom
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            
-            # Wait for potential content to load
-            time.sleep(2)
+            # Scroll to bottom, wait for potential content to load and check
+            # for new content, without leaving the browser in between
+            new_height, current_product_count = self.driver.execute_async_script(SCROLL_AND_WAIT_SCRIPT, 2000, PRODUCT_ITEM_SELECTOR)
             
             # Try to trigger any "Load More" buttons
             if scroll_attempt % 3 == 0:  # Every 3rd scroll attempt
                 self.trigger_load_more_buttons()
                 time.sleep(1)
-            
-            # Check for new content
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            current_product_count = self.count_products_on_current_page()
+                new_height, current_product_count = self.driver.execute_script(SCROLL_STATE_SCRIPT, PRODUCT_ITEM_SELECTOR)
             
             if current_product_count > last_product_count:
                 logger.info(f"Scroll {scroll_attempt + 1}: Found {current_product_count} products (+{current_product_count - last_product_count})")
@@ -93,6 +298,10 @@ class ImprovedTextileWorldScraper:
             
             last_height = new_height
             
+            if current_product_count + current_total >= self.target_count:
+                logger.info("Enough products loaded to reach the target")
+                break
+            
             # If no changes for several iterations, we've likely loaded everything
             if stable_iterations >= max_stable_iterations:
                 logger.info("No more content loading - page fully scrolled")
@@ -100,10 +309,8 @@ class ImprovedTextileWorldScraper:
             
             # Additional scroll techniques for stubborn pages
             if scroll_attempt % 5 == 0:
-                # Try scrolling in smaller increments
-                for i in range(3):
-                    self.driver.execute_script(f"window.scrollBy(0, {200 + i * 100});")
-                    time.sleep(0.5)
+                # Try scrolling in smaller increments, scheduled in the browser
+                self.driver.execute_async_script(INCREMENTAL_SCROLL_SCRIPT)
         
         final_count = self.count_products_on_current_page()
         logger.info(f"Infinite scroll complete: {initial_count} → {final_count} products (+{final_count - initial_count})")
@@ -126,10 +333,10 @@ class ImprovedTextileWorldScraper:
             logger.info(f"\n=== Processing Page {page} ===")
             
             # First, perform infinite scroll on current page
-            products_after_scroll = self.infinite_scroll_current_page()
+            products_after_scroll = self.infinite_scroll_current_page(len(all_products))
             
-            # Extract all products from the fully loaded page
-            page_products = self.extract_products_from_current_page()
+            # Extract all products from the fully loaded page, but no more than the target still needs
+            page_products = self.extract_products_from_current_page(self.target_count - len(all_products))
             all_products.extend(page_products)
             
             logger.info(f"Products extracted from page {page}: {len(page_products)}")
@@ -184,62 +391,32 @@ class ImprovedTextileWorldScraper:
     
     def trigger_load_more_buttons(self):
         """Find and click various types of load more buttons"""
-        load_more_selectors = [
-            # Common button texts
-            "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'load more')]",
-            "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'show more')]",
-            "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'more products')]",
-            "//a[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'load more')]",
-            
-            # Common CSS classes and IDs
-            ".load-more",
-            ".show-more", 
-            ".load-more-products",
-            ".btn-load-more",
-            "#load-more",
-            "#show-more",
-            "[data-role='load-more']",
-            "[data-action='load-more']",
-            
-            # Generic button patterns
-            "button[class*='load']",
-            "button[class*='more']",
-            "a[class*='load']",
-            "a[class*='more']"
-        ]
+        try:
+            # First usable element per rule, found in one DOM scan in the browser
+            candidates = self.driver.execute_script(CLICKABLE_CANDIDATES_SCRIPT, LOAD_MORE_RULES, False)
+        except Exception as e:
+            logger.debug(f"Load more button lookup failed: {e}")
+            return False
         
         buttons_clicked = 0
         
-        for selector in load_more_selectors:
+        # Only the first matching button per rule is clicked
+        for element in candidates:
+            if element is None:
+                continue
             try:
-                if selector.startswith("//"):
-                    # XPath selector
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                else:
-                    # CSS selector
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                # Check if button is in viewport
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+                time.sleep(0.5)
+                
+                button_text = element.text.strip().lower()
+                logger.info(f"Clicking button: '{button_text}'")
+                
+                # Try clicking with JavaScript to avoid interception
+                self.driver.execute_script("arguments[0].click();", element)
+                buttons_clicked += 1
+                time.sleep(2)
                 
-                for element in elements:
-                    try:
-                        if element.is_displayed() and element.is_enabled():
-                            # Check if button is in viewport
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                            time.sleep(0.5)
-                            
-                            button_text = element.text.strip().lower()
-                            logger.info(f"Clicking button: '{button_text}'")
-                            
-                            # Try clicking with JavaScript to avoid interception
-                            self.driver.execute_script("arguments[0].click();", element)
-                            buttons_clicked += 1
-                            time.sleep(2)
-                            
-                            # Only click first matching button per selector
-                            break
-                            
-                    except Exception as e:
-                        continue
-                        
             except Exception as e:
                 continue
         
@@ -253,66 +430,30 @@ class ImprovedTextileWorldScraper:
         """Find and click the next page button with enhanced detection"""
         logger.info("Looking for next page button...")
         
-        next_selectors = [
-            # XPath selectors for text-based matching
-            "//a[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'next')]",
-            "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'next')]",
-            "//a[contains(text(), '>')]",
-            "//a[contains(text(), '→')]",
-            "//a[contains(text(), '»')]",
-            
-            # Attribute-based selectors
-            "a[title*='Next' i]",
-            "a[aria-label*='Next' i]",
-            "button[title*='Next' i]",
-            "button[aria-label*='Next' i]",
-            
-            # Class-based selectors
-            ".next",
-            ".next-page", 
-            ".pagination-next",
-            ".pager-next a",
-            ".page-next",
-            
-            # Generic pagination patterns
-            ".pagination a[href*='p=']",
-            ".pagination a[href*='page=']",
-            ".pager a[href*='p=']",
-            
-            # ID-based selectors
-            "#next-page",
-            "#pagination-next"
-        ]
+        try:
+            # First visible link per rule with a real (non javascript:) href
+            candidates = self.driver.execute_script(CLICKABLE_CANDIDATES_SCRIPT, NEXT_PAGE_RULES, True)
+        except Exception as e:
+            logger.debug(f"Next page button lookup failed: {e}")
+            candidates = []
         
-        for selector in next_selectors:
+        for element in candidates:
+            if element is None:
+                continue
             try:
-                if selector.startswith("//"):
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                else:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                href = element.get_attribute("href")
+                text = element.text.strip()
+                logger.info(f"Found next page button: '{text}' -> {href}")
+                
+                # Scroll to element and click
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+                time.sleep(1)
+                self.driver.execute_script("arguments[0].click();", element)
+                
+                # Wait for navigation
+                time.sleep(3)
+                return True
                 
-                for element in elements:
-                    try:
-                        if element.is_displayed() and element.is_enabled():
-                            href = element.get_attribute("href")
-                            text = element.text.strip()
-                            
-                            # Skip javascript: links and empty links
-                            if href and "javascript:" not in href:
-                                logger.info(f"Found next page button: '{text}' -> {href}")
-                                
-                                # Scroll to element and click
-                                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                                time.sleep(1)
-                                self.driver.execute_script("arguments[0].click();", element)
-                                
-                                # Wait for navigation
-                                time.sleep(3)
-                                return True
-                                
-                    except Exception as e:
-                        continue
-                        
             except Exception as e:
                 continue
         
@@ -325,49 +466,15 @@ class ImprovedTextileWorldScraper:
         
         # Strategy 1: Count product links
         try:
-            product_link_patterns = [
-                "a[href*='.html']",
-                "a[title]",
-                ".product-item a",
-                ".product a", 
-                "a[href*='product']",
-                ".item a"
-            ]
-            
-            for pattern in product_link_patterns:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, pattern)
-                product_count = 0
-                
-                for elem in elements:
-                    href = elem.get_attribute("href") or ""
-                    title = elem.get_attribute("title") or ""
-                    text = elem.text or ""
-                    
-                    combined_text = (href + " " + title + " " + text).lower()
-                    if any(brand in combined_text for brand in ['jack', 'jones', 'morning', 'soya', 'selected']):
-                        product_count += 1
-                
-                if product_count > 0:
-                    counts.append(product_count)
+            link_counts = self.driver.execute_script(PRODUCT_LINK_COUNT_SCRIPT, PRODUCT_LINK_SELECTORS, BRAND_KEYWORDS)
+            counts.extend(product_count for product_count in link_counts if product_count > 0)
                     
         except Exception as e:
             logger.debug(f"Product link counting failed: {e}")
         
         # Strategy 2: Count brand mentions in page source
         try:
-            page_text = self.driver.page_source.lower()
-            brand_patterns = [
-                r'jack\s*&\s*jones',
-                r'jack\s*jones',
-                r'new\s*morning',
-                r'soyaconcept',
-                r'selected\s*homme'
-            ]
-            
-            total_mentions = 0
-            for pattern in brand_patterns:
-                matches = re.findall(pattern, page_text)
-                total_mentions += len(matches)
+            total_mentions = self.driver.execute_script(BRAND_MENTION_COUNT_SCRIPT, BRAND_MENTION_RE.pattern)
             
             if total_mentions > 0:
                 # Estimate products (each product might be mentioned 2-3 times)
@@ -401,65 +508,100 @@ class ImprovedTextileWorldScraper:
         
         return final_count
     
-    def extract_products_from_current_page(self):
-        """Enhanced product extraction from current page"""
+    def extract_products_from_current_page(self, needed=None):
+        """Enhanced product extraction from current page.
+        
+        With `needed` set, extraction stops once that many unique products are found.
+        """
         logger.info("Extracting products from fully loaded page...")
         
+        # Duplicates are dropped as they are found, so they never enter the list
+        # and extraction can stop as soon as `needed` unique products are in
         products = []
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+        found_keys = set()
+        soup = self.parse_html(self.driver.page_source)
+        # Prices already found in this page's elements, see find_price_near_element_bs4
+        price_cache = {}
+        
+        # Strategy 1: Extract from structured containers
+        container_selectors = [
+            '.product-item', '.product', '.item', 
+            '[data-product-id]', '.catalog-product'
+        ]
+        
+        for selector in container_selectors:
+            if needed is not None and len(found_keys) >= needed:
+                break
+            
+            containers = soup.select(selector)
+            for container in containers:
+                product_data = self.extract_from_container_bs4(container, price_cache)
+                if product_data and self.is_valid_product(product_data):
+                    key = self.product_key(product_data)
+                    if key is not None and key not in found_keys:
+                        found_keys.add(key)
+                        products.append(product_data)
+                    if needed is not None and len(found_keys) >= needed:
+                        break
         
-        # Strategy 1: Extract from all links
-        all_links = soup.find_all('a', href=True)
+        # Strategy 2: Extract from all links. Scanning every <a> (navigation and
+        # footer included) mostly finds the container products again, so it
+        # only runs when the containers didn't give a full page
+        all_links = soup.find_all('a', href=True) if len(products) < MIN_CONTAINER_PRODUCTS else []
         
         for link in all_links:
+            if needed is not None and len(found_keys) >= needed:
+                break
+            
             href = link.get('href', '')
+            if not href:
+                continue
             title = link.get('title', '')
-            text = link.get_text(strip=True)
             
-            combined_text = (href + " " + title + " " + text).lower()
+            # Gathering the link text walks its whole subtree, so it's done once
+            # and only for links with an href; the brand is looked up in href,
+            # title and text in turn instead of in a joined copy of all three
+            text = link.get_text(strip=True)
+            if len(text) <= 3:
+                continue
             
             # Enhanced brand detection
-            brand_keywords = [
-                'jack', 'jones', 'morning', 'soya', 'selected',
-                'jackjones', 'jack&jones'
-            ]
+            has_brand = (BRAND_RE.search(href) is not None or BRAND_RE.search(title) is not None
+                         or BRAND_RE.search(text) is not None)
             
-            has_brand = any(brand in combined_text for brand in brand_keywords)
-            
-            if has_brand and len(text) > 3 and href:
+            if has_brand:
                 product_data = {
                     'name': title or text,
                     'url': href,
-                    'price': self.find_price_near_element_bs4(link, soup),
+                    'price': self.find_price_near_element_bs4(link, soup, price_cache),
                     'source_page': self.driver.current_url,
                     'raw_text': text[:100],
                     'extraction_method': 'link_analysis'
                 }
                 
                 if self.is_valid_product(product_data):
-                    products.append(product_data)
-        
-        # Strategy 2: Extract from structured containers
-        container_selectors = [
-            '.product-item', '.product', '.item', 
-            '[data-product-id]', '.catalog-product'
-        ]
-        
-        for selector in container_selectors:
-            containers = soup.select(selector)
-            for container in containers:
-                product_data = self.extract_from_container_bs4(container)
-                if product_data and self.is_valid_product(product_data):
-                    products.append(product_data)
-        
-        # Remove duplicates
-        unique_products = self.deduplicate_products(products)
+                    key = self.product_key(product_data)
+                    if key is not None and key not in found_keys:
+                        found_keys.add(key)
+                        products.append(product_data)
         
-        logger.info(f"Extracted {len(unique_products)} unique products from current page")
-        return unique_products
+        logger.info(f"Extracted {len(products)} unique products from current page")
+        return products
+    
+    def parse_html(self, html):
+        """Parse page HTML with the fast lxml backend, falling back to html.parser"""
+        try:
+            return BeautifulSoup(html, 'lxml')
+        except FeatureNotFound:
+            return BeautifulSoup(html, 'html.parser')
     
-    def find_price_near_element_bs4(self, element, soup):
-        """Enhanced price detection"""
+    def find_price_near_element_bs4(self, element, soup, price_cache=None):
+        """Enhanced price detection.
+        
+        `price_cache` maps the id() of elements already searched to the price
+        found in their text ('' for none). Sharing one dict across a page lets
+        sibling links reuse the text of their common ancestors.
+        """
         search_elements = [element]
         
         # Add parent elements for context
@@ -471,34 +613,36 @@ class ImprovedTextileWorldScraper:
             else:
                 break
         
-        # Enhanced price patterns
-        price_patterns = [
-            r'(\d+[.,]\d{2})\s*€',
-            r'€\s*(\d+[.,]\d{2})',
-            r'\$\s*(\d+[.,]\d{2})',
-            r'(\d+[.,]\d{2})\s*\$',
-            r'(\d{1,4}[.,]\d{2})',
-            r'(\d{1,4})\s*€',
-            r'€\s*(\d{1,4})',
-        ]
-        
         for search_elem in search_elements:
-            text = search_elem.get_text() if hasattr(search_elem, 'get_text') else str(search_elem)
-            
-            for pattern in price_patterns:
-                matches = re.findall(pattern, text)
-                for match in matches:
-                    try:
-                        price = match.replace(',', '.')
-                        price_float = float(price)
-                        if 1 <= price_float <= 2000:  # Reasonable price range
-                            return f"{price_float:.2f}"
-                    except:
-                        continue
+            if price_cache is not None and id(search_elem) in price_cache:
+                price = price_cache[id(search_elem)]
+            else:
+                text = search_elem.get_text() if hasattr(search_elem, 'get_text') else str(search_elem)
+                price = self.find_price_in_text(text)
+                if price_cache is not None:
+                    price_cache[id(search_elem)] = price
+            
+            if price:
+                return price
+        
+        return ""
+    
+    def find_price_in_text(self, text):
+        """Return the first plausible price in text as '12.34', or '' if there is none"""
+        for pattern in PRICE_PATTERNS:
+            matches = pattern.findall(text)
+            for match in matches:
+                try:
+                    price = match.replace(',', '.')
+                    price_float = float(price)
+                    if 1 <= price_float <= 2000:  # Reasonable price range
+                        return f"{price_float:.2f}"
+                except:
+                    continue
         
         return ""
     
-    def extract_from_container_bs4(self, container):
+    def extract_from_container_bs4(self, container, price_cache=None):
         """Enhanced container-based extraction"""
         try:
             # Find product name with multiple strategies
@@ -526,7 +670,7 @@ class ImprovedTextileWorldScraper:
                 url = link.get('href', '')
             
             # Find price
-            price = self.find_price_near_element_bs4(container, None)
+            price = self.find_price_near_element_bs4(container, None, price_cache)
             
             return {
                 'name': name,
@@ -546,45 +690,25 @@ class ImprovedTextileWorldScraper:
         if len(name) < 3:
             return False
         
-        # Check for brand indicators (case insensitive)
-        name_lower = name.lower()
-        brand_keywords = [
-            'jack', 'jones', 'morning', 'soya', 'selected',
-            'jackjones', 'jack&jones', 'soyaconcept'
-        ]
-        
-        has_brand = any(brand in name_lower for brand in brand_keywords)
-        
-        # Additional validation: avoid navigation/menu items
-        invalid_indicators = [
-            'search', 'menu', 'navigation', 'footer', 'header',
-            'login', 'register', 'cart', 'checkout', 'contact'
-        ]
-        
-        has_invalid = any(invalid in name_lower for invalid in invalid_indicators)
-        
-        return has_brand and not has_invalid
+        # Check for brand indicators (case insensitive), and avoid navigation/menu items
+        return BRAND_RE.search(name) is not None and INVALID_NAME_RE.search(name) is None
     
-    def deduplicate_products(self, products):
-        """Enhanced deduplication"""
-        seen = set()
-        unique_products = []
-        
-        for product in products:
-            name = product.get('name', '').strip()
-            url = product.get('url', '').strip()
-            
-            # Create normalized key from name and URL
-            name_key = re.sub(r'[^\w\s]', '', name.lower()).replace(' ', '')
-            url_key = url.split('?')[0] if url else ''  # Remove query parameters
-            
-            combined_key = f"{name_key}|{url_key}"
-            
-            if len(name_key) > 3 and combined_key not in seen:
-                seen.add(combined_key)
-                unique_products.append(product)
-        
-        return unique_products
+    def product_key(self, product):
+        """Key identifying a product, or None if it has no URL and its name is too short to keep.
+        
+        Products are keyed on their URL; only those without one fall back to
+        the normalized name.
+        """
+        url = product.get('url', '').strip()
+        if url:
+            return url.split('?')[0]  # Remove query parameters
+        
+        # Create normalized key from the name
+        name = product.get('name', '').strip()
+        name_key = NON_WORD_RE.sub('', name.lower()).replace(' ', '')
+        if len(name_key) <= 3:
+            return None
+        return name_key
     
     def smart_scraping_approach(self):
         """Enhanced smart scraping with per-page infinite scroll"""
@@ -606,12 +730,11 @@ class ImprovedTextileWorldScraper:
         # Save CSV
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
             fieldnames = ['name', 'price', 'url', 'source_page', 'extraction_method', 'raw_text']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            # Missing fields are written as '' and extra keys are skipped, so rows
+            # stream straight from the product dicts without building copies
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames, restval='', extrasaction='ignore')
             writer.writeheader()
-            
-            for product in products:
-                row = {field: product.get(field, '') for field in fieldnames}
-                writer.writerow(row)
+            writer.writerows(products)
         
         # Save JSON with additional metadata
         json_data = {
@@ -623,9 +746,15 @@ class ImprovedTextileWorldScraper:
             'products': products
         }
         
+        # With indent, the stdlib encoder drops to its pure-Python path, so
+        # prefer orjson when it's installed
         json_filename = filename.replace('.csv', '.json')
-        with open(json_filename, 'w', encoding='utf-8') as jsonfile:
-            json.dump(json_data, jsonfile, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(json_filename, 'wb') as jsonfile:
+                jsonfile.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_filename, 'w', encoding='utf-8') as jsonfile:
+                json.dump(json_data, jsonfile, indent=2, ensure_ascii=False)
         
         logger.info(f"✓ Results saved to: {filename} and {json_filename}")
         return filename
@@ -643,7 +772,8 @@ class ImprovedTextileWorldScraper:
             # Load initial page
             logger.info("Loading initial page...")
             self.driver.get(url)
-            time.sleep(5)
+            if not self.wait_for_products():
+                logger.warning("Product grid not found - continuing with whatever loaded")
             
             # Use enhanced smart scraping
             products = self.smart_scraping_approach()
@@ -1,15 +1,168 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer, FeatureNotFound
 import csv
 import time
 import re
 from urllib.parse import urljoin
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import logging
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Kept-alive connections per host; scrape_all_pages workers beyond this would
+# have their connections discarded and pay a new TLS handshake per request
+POOL_SIZE = 32
+
+CSV_FIELDNAMES = [
+    'page_number', 'sku', 'title', 'price', 'price_postfix', 
+    'subtitle', 'specs', 'is_new', 'image_url', 'product_url'
+]
+
+# The sections extract_product_info reads from a product card, as (tag, class)
+CARD_SECTIONS = {
+    ('div', 'logo-container'),
+    ('div', 'price-box'),
+    ('div', 'product-info'),
+    ('div', 'collateral-box'),
+    ('p', 'new-product'),
+}
+
+# Only build the product containers (div.item / li.item) and what's inside them;
+# the rest of the page is skipped by the parser. The class is matched as a
+# whole word so "item last" counts but "menu-item" doesn't
+PRODUCT_STRAINER = SoupStrainer(['div', 'li'], attrs={'class': re.compile(r'(?:^|\s)item(?:\s|$)')})
+
+def parse_html(content):
+    """Parse listing HTML with the fast lxml backend, falling back to html.parser"""
+    try:
+        return BeautifulSoup(content, 'lxml', parse_only=PRODUCT_STRAINER)
+    except FeatureNotFound:
+        return BeautifulSoup(content, 'html.parser', parse_only=PRODUCT_STRAINER)
+
+def extract_product_info(product_element):
+    """Extract product information from a product element"""
+    product_data = {}
+    
+    # Find the first of each section in one walk over the card, instead of
+    # walking it again for every section
+    sections = {}
+    for element in product_element.find_all(['div', 'p'], class_=True):
+        for css_class in element['class']:
+            if (element.name, css_class) in CARD_SECTIONS:
+                sections.setdefault(css_class, element)
+        if len(sections) == len(CARD_SECTIONS):
+            break
+    
+    # Extract logo/image
+    logo_container = sections.get('logo-container')
+    if logo_container:
+        img = logo_container.find('img')
+        product_data['image_url'] = img.get('src', '') if img else ''
+    else:
+        product_data['image_url'] = ''
+    
+    # Extract price
+    price_box = sections.get('price-box')
+    if price_box:
+        price_span = price_box.find('span', class_='price')
+        if price_span:
+            # Extract the innermost price span
+            inner_price = price_span.find('span', class_='price')
+            product_data['price'] = inner_price.text.strip() if inner_price else price_span.text.strip()
+        else:
+            product_data['price'] = ''
+        
+        # Extract price postfix (tax info)
+        postfix = price_box.find('span', class_='price-postfix')
+        product_data['price_postfix'] = postfix.text.strip() if postfix else ''
+    else:
+        product_data['price'] = ''
+        product_data['price_postfix'] = ''
+    
+    # Extract product info
+    product_info = sections.get('product-info')
+    if product_info:
+        # SKU
+        sku_p = product_info.find('p', class_='sku')
+        product_data['sku'] = sku_p.text.strip() if sku_p else ''
+        
+        # Product title and link
+        title_h5 = product_info.find('h5')
+        if title_h5:
+            title_link = title_h5.find('a')
+            if title_link:
+                product_data['title'] = title_link.text.strip()
+                product_data['product_url'] = urljoin("https://www.textileworld.eu", title_link.get('href', ''))
+            else:
+                product_data['title'] = title_h5.text.strip()
+                product_data['product_url'] = ''
+        else:
+            product_data['title'] = ''
+            product_data['product_url'] = ''
+    else:
+        product_data['sku'] = ''
+        product_data['title'] = ''
+        product_data['product_url'] = ''
+    
+    # Extract collateral box info
+    collateral_box = sections.get('collateral-box')
+    if collateral_box:
+        # Product subtitle
+        subtitle_div = collateral_box.find('div', class_='product-subtitle')
+        product_data['subtitle'] = subtitle_div.text.strip() if subtitle_div else ''
+        
+        # Product specs
+        specs_div = collateral_box.find('div', class_='product-specs')
+        product_data['specs'] = specs_div.text.strip() if specs_div else ''
+    else:
+        product_data['subtitle'] = ''
+        product_data['specs'] = ''
+    
+    # Check if new product
+    new_product = sections.get('new-product')
+    product_data['is_new'] = 'Yes' if new_product and new_product.text.strip() else 'No'
+    logger.debug(product_data)
+    
+    return product_data
+
+
+def parse_products(content, page_num):
+    """Parse a fetched listing page into its products, or None if it has no product containers.
+    
+    A top-level function so scrape_all_pages can run it in a process pool.
+    """
+    soup = parse_html(content)
+    
+    # Find all product containers - you might need to adjust this selector
+    # based on the actual HTML structure
+    products = soup.find_all('div', class_='item')  # Adjust class name as needed
+    
+    if not products:
+        # Try alternative selectors
+        products = soup.find_all('li', class_='item')
+        
+    if not products:
+        logger.info(f"No products found on page {page_num}")
+        return None
+    
+    page_products = []
+    for product in products:
+        try:
+            product_data = extract_product_info(product)
+            if product_data.get('title'):  # Only add if we have a title
+                product_data['page_number'] = page_num
+                page_products.append(product_data)
+        except Exception as e:
+            logger.error(f"Error extracting product data: {e}")
+            continue
+    
+    return page_products
+
 class TextileWorldScraper:
     def __init__(self, base_url="https://www.textileworld.eu/catalogsearch/result/index/adjclear/true/p/"):
         self.base_url = base_url
@@ -18,156 +171,135 @@ class TextileWorldScraper:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # Reuse one kept-alive connection per concurrent page fetch, and retry
+        # rate limiting and server errors with exponential backoff (honouring
+        # Retry-After) instead of counting the page as empty
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.products = []
+        self.product_count = 0
+        # Set while scrape_all_pages streams products to a CSV file
+        self.csvfile = None
+        self.csv_writer = None
     
-    def get_page(self, page_num):
-        """Fetch a single page and return BeautifulSoup object"""
+    def fetch_page(self, page_num):
+        """Fetch a single page and return its HTML bytes, or None on failure"""
         url = f"{self.base_url}{page_num}/"
         try:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
         except requests.RequestException as e:
             logger.error(f"Error fetching page {page_num}: {e}")
             return None
+        return response.content
     
-    def extract_product_info(self, product_element):
-        """Extract product information from a product element"""
-        product_data = {}
-        
-        # Extract logo/image
-        logo_container = product_element.find('div', class_='logo-container')
-        if logo_container:
-            img = logo_container.find('img')
-            product_data['image_url'] = img.get('src', '') if img else ''
-        else:
-            product_data['image_url'] = ''
-        
-        # Extract price
-        price_box = product_element.find('div', class_='price-box')
-        if price_box:
-            price_span = price_box.find('span', class_='price')
-            if price_span:
-                # Extract the innermost price span
-                inner_price = price_span.find('span', class_='price')
-                product_data['price'] = inner_price.text.strip() if inner_price else price_span.text.strip()
-            else:
-                product_data['price'] = ''
-            
-            # Extract price postfix (tax info)
-            postfix = price_box.find('span', class_='price-postfix')
-            product_data['price_postfix'] = postfix.text.strip() if postfix else ''
-        else:
-            product_data['price'] = ''
-            product_data['price_postfix'] = ''
-        
-        # Extract product info
-        product_info = product_element.find('div', class_='product-info')
-        if product_info:
-            # SKU
-            sku_p = product_info.find('p', class_='sku')
-            product_data['sku'] = sku_p.text.strip() if sku_p else ''
-            
-            # Product title and link
-            title_h5 = product_info.find('h5')
-            if title_h5:
-                title_link = title_h5.find('a')
-                if title_link:
-                    product_data['title'] = title_link.text.strip()
-                    product_data['product_url'] = urljoin("https://www.textileworld.eu", title_link.get('href', ''))
-                else:
-                    product_data['title'] = title_h5.text.strip()
-                    product_data['product_url'] = ''
-            else:
-                product_data['title'] = ''
-                product_data['product_url'] = ''
-        else:
-            product_data['sku'] = ''
-            product_data['title'] = ''
-            product_data['product_url'] = ''
-        
-        # Extract collateral box info
-        collateral_box = product_element.find('div', class_='collateral-box')
-        if collateral_box:
-            # Product subtitle
-            subtitle_div = collateral_box.find('div', class_='product-subtitle')
-            product_data['subtitle'] = subtitle_div.text.strip() if subtitle_div else ''
-            
-            # Product specs
-            specs_div = collateral_box.find('div', class_='product-specs')
-            product_data['specs'] = specs_div.text.strip() if specs_div else ''
-        else:
-            product_data['subtitle'] = ''
-            product_data['specs'] = ''
-        
-        # Check if new product
-        new_product = product_element.find('p', class_='new-product')
-        product_data['is_new'] = 'Yes' if new_product and new_product.text.strip() else 'No'
-        print(product_data)
-        
-        return product_data
+    def fetch_and_parse_page(self, page_num, parse_pool=None):
+        """Fetch a page and parse its products, in `parse_pool` if given; None if either step found nothing"""
+        content = self.fetch_page(page_num)
+        if content is None:
+            return None
+        if parse_pool is not None:
+            return parse_pool.submit(parse_products, content, page_num).result()
+        return parse_products(content, page_num)
     
     def scrape_page(self, page_num):
         """Scrape products from a single page"""
         logger.info(f"Scraping page {page_num}")
-        soup = self.get_page(page_num)
-        
-        if not soup:
-            return False
-        
-        # Find all product containers - you might need to adjust this selector
-        # based on the actual HTML structure
-        products = soup.find_all('div', class_='item')  # Adjust class name as needed
-        
-        if not products:
-            # Try alternative selectors
-            products = soup.find_all('li', class_='item')
-            
-        if not products:
-            logger.info(f"No products found on page {page_num}")
+        return self.process_page(page_num, self.fetch_and_parse_page(page_num))
+    
+    def process_page(self, page_num, page_products):
+        """Collect a page's parsed products (None if it couldn't be fetched or had none); returns whether it had any"""
+        if page_products is None:
             return False
         
-        page_products = []
-        for product in products:
-            try:
-                product_data = self.extract_product_info(product)
-                if product_data.get('title'):  # Only add if we have a title
-                    product_data['page_number'] = page_num
-                    page_products.append(product_data)
-            except Exception as e:
-                logger.error(f"Error extracting product data: {e}")
-                continue
-        
-        self.products.extend(page_products)
+        self.product_count += len(page_products)
+        if self.csv_writer is not None:
+            self.csv_writer.writerows(page_products)
+            self.csvfile.flush()
+        else:
+            self.products.extend(page_products)
         logger.info(f"Found {len(page_products)} products on page {page_num}")
         return len(page_products) > 0
     
-    def scrape_all_pages(self, start_page=1, max_pages=None, delay=1):
-        """Scrape all pages until no more products are found"""
-        page_num = start_page
+    def scrape_all_pages(self, start_page=1, max_pages=None, delay=1, workers=4, filename=None, parse_processes=None):
+        """Scrape all pages until no more products are found.
+        
+        Up to `workers` pages are fetched and parsed at once, with a new request
+        starting at most every `delay` seconds; pages are still processed in
+        order, so the stop rule sees them exactly as before.
+        
+        With `filename` set, each page's products are written to that CSV as
+        soon as the page is processed instead of being kept in `self.products`,
+        so memory stays flat and an interrupted run keeps the pages it finished.
+        
+        Parsing holds the GIL, so with little or no `delay` the fetch threads
+        end up waiting on each other's parsing; `parse_processes` moves it to a
+        pool of that many processes so pages are parsed on several cores.
+        """
         consecutive_empty_pages = 0
         max_consecutive_empty = 3  # Stop after 3 consecutive empty pages
         
-        while True:
-            if max_pages and page_num > max_pages:
-                break
+        pending = deque()
+        next_page = start_page
+        last_request = None
+        
+        if filename:
+            # A 1 MiB buffer keeps the number of write() calls low; flushed after each page
+            self.csvfile = open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+            self.csv_writer = csv.DictWriter(self.csvfile, fieldnames=CSV_FIELDNAMES)
+            self.csv_writer.writeheader()
+        
+        parse_pool = ProcessPoolExecutor(max_workers=parse_processes) if parse_processes else None
+        
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                while True:
+                    # Keep the pool busy so one slow response doesn't stall the pages after it
+                    while len(pending) < workers and not (max_pages and next_page > max_pages):
+                        # Add delay to be respectful to the server
+                        if last_request is not None:
+                            wait = last_request + delay - time.monotonic()
+                            if wait > 0:
+                                time.sleep(wait)
+                        last_request = time.monotonic()
+                        
+                        logger.info(f"Scraping page {next_page}")
+                        pending.append((next_page, executor.submit(self.fetch_and_parse_page, next_page, parse_pool)))
+                        next_page += 1
+                    
+                    if not pending:
+                        break
+                    
+                    page_num, future = pending.popleft()
+                    has_products = self.process_page(page_num, future.result())
+                    
+                    if not has_products:
+                        consecutive_empty_pages += 1
+                        if consecutive_empty_pages >= max_consecutive_empty:
+                            logger.info(f"Stopping after {consecutive_empty_pages} consecutive empty pages")
+                            break
+                    else:
+                        consecutive_empty_pages = 0
                 
-            has_products = self.scrape_page(page_num)
-            
-            if not has_products:
-                consecutive_empty_pages += 1
-                if consecutive_empty_pages >= max_consecutive_empty:
-                    logger.info(f"Stopping after {consecutive_empty_pages} consecutive empty pages")
-                    break
-            else:
-                consecutive_empty_pages = 0
-            
-            page_num += 1
-            
-            # Add delay to be respectful to the server
-            time.sleep(delay)
+                # Pages past the end don't need fetching
+                for _, future in pending:
+                    future.cancel()
+        finally:
+            if parse_pool is not None:
+                parse_pool.shutdown(cancel_futures=True)
+            if self.csvfile is not None:
+                self.csvfile.close()
+                self.csvfile = None
+                self.csv_writer = None
         
-        logger.info(f"Scraping completed. Total products found: {len(self.products)}")
+        logger.info(f"Scraping completed. Total products found: {self.product_count}")
+        if filename and self.product_count == 0:
+            logger.warning(f"No products to save, {filename} only has the header")
     
     def save_to_csv(self, filename='textileworld_products.csv'):
         """Save scraped products to CSV file"""
@@ -175,13 +307,9 @@ class TextileWorldScraper:
             logger.warning("No products to save")
             return
         
-        fieldnames = [
-            'page_number', 'sku', 'title', 'price', 'price_postfix', 
-            'subtitle', 'specs', 'is_new', 'image_url', 'product_url'
-        ]
-        
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        # A 1 MiB buffer keeps the number of write() calls low on large runs
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES)
             writer.writeheader()
             writer.writerows(self.products)
         
@@ -191,14 +319,12 @@ def main():
     """Main function to run the scraper"""
     scraper = TextileWorldScraper()
     
-    # Test with first few pages
+    # Test with first few pages, saving each page to CSV as it is scraped
     print("Starting scrape...")
-    scraper.scrape_all_pages(start_page=1, max_pages=5, delay=2)  # Start with 5 pages for testing
-    
-    # Save to CSV
-    scraper.save_to_csv('textileworld_products.csv')
+    scraper.scrape_all_pages(start_page=1, max_pages=5, delay=2,  # Start with 5 pages for testing
+                             filename='textileworld_products.csv')
     
-    print(f"Scraping completed! Found {len(scraper.products)} products")
+    print(f"Scraping completed! Found {scraper.product_count} products")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,14 +5,21 @@ CSV_FILE = "products_simple.csv"
 def load_products(csv_file=CSV_FILE):
     products = []
     with open(csv_file, newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
+        # Plain rows zipped onto the header in C, without DictReader's per-row bookkeeping
+        reader = csv.reader(f)
+        header = next(reader, [])
+        for values in reader:
+            if not values:
+                continue  # blank line, as DictReader skips
+            row = dict(zip(header, values))
+            # Lowercase each name once here rather than on every search
+            row['_name_lc'] = row['name'].lower()
             products.append(row)
     return products
 
 def find_price(products, query):
     query_lower = query.lower()
-    matches = [p for p in products if query_lower in p['name'].lower()]
+    matches = [p for p in products if query_lower in p['_name_lc']]
     return matches
 
 def main():